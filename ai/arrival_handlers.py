@@ -28,14 +28,16 @@ from game.sim.determinism import get_rng
 from game.sim.direct_prompt_targets import resolve_explore_direction_target
 from game.sim.timebase import now_ms as sim_now_ms
 
+from ai.behaviors import tick_index
 from ai.behaviors.task_durations import roll_duration_seconds
-from ai.behaviors.view_compat import as_ai_view, view_to_legacy_context
+from ai.behaviors.view_compat import as_ai_view
 from ai.contracts import HeroTask, TargetType, coerce_task
 
 # WK50 R18: sovereign explore legs chained from the initial compass commit
 # (tiles per extension). Moved verbatim from bounty_pursuit.py with the
 # direct-prompt arrival logic.
 _DIRECT_PROMPT_EXPLORE_EXTENSION_TILES = 12
+_ARRIVAL_REACH_SQ = (TILE_SIZE * 2) ** 2
 _DIRECT_PROMPT_EXPLORE_MAX_EXTENSIONS = 2
 
 
@@ -66,11 +68,12 @@ def _pick_building_at_arrival(
     reach_mult: float = 2.5,
 ) -> Any | None:
     """Prefer the building whose center best matches the sovereign waypoint among those in reach."""
-    reach = TILE_SIZE * reach_mult
+    reach_sq = (TILE_SIZE * reach_mult) ** 2
+    hx, hy = hero.x, hero.y
     best = None
     best_d = 1e18
     for building in buildings:
-        if hero.distance_to(building.center_x, building.center_y) > reach:
+        if (hx - building.center_x) ** 2 + (hy - building.center_y) ** 2 > reach_sq:
             continue
         d = (building.center_x - dest_x) ** 2 + (building.center_y - dest_y) ** 2
         if d < best_d:
@@ -81,15 +84,15 @@ def _pick_building_at_arrival(
 
 def _find_safety_building_for_arrival(hero: Any, buildings: list[Any]) -> Any | None:
     """Inn/castle/home within short range (same window as ``return_home`` direct prompt)."""
+    hx, hy = hero.x, hero.y
     rest_b = None
-    if hero.home_building and hero.distance_to(
-        hero.home_building.center_x, hero.home_building.center_y
-    ) <= TILE_SIZE * 2:
-        rest_b = hero.home_building
+    home = hero.home_building
+    if home and (hx - home.center_x) ** 2 + (hy - home.center_y) ** 2 <= _ARRIVAL_REACH_SQ:
+        rest_b = home
     if rest_b is None:
         for building in buildings:
             if getattr(building, "building_type", None) in ("castle", "inn"):
-                if hero.distance_to(building.center_x, building.center_y) <= TILE_SIZE * 2:
+                if (hx - building.center_x) ** 2 + (hy - building.center_y) ** 2 <= _ARRIVAL_REACH_SQ:
                     rest_b = building
                     break
     return rest_b
@@ -119,11 +122,10 @@ def handle_direct_prompt_arrival(ai: Any, hero: Any, task: HeroTask, view: Any)
         return True
     if sub == "buy_potions":
         shop = None
-        for building in view.buildings:
-            if building.building_type in ("marketplace", "blacksmith"):
-                if hero.distance_to(building.center_x, building.center_y) < TILE_SIZE * 2:
-                    shop = building
-                    break
+        for building in tick_index.buildings_of_type(view, "marketplace", "blacksmith"):
+            if (hero.x - building.center_x) ** 2 + (hero.y - building.center_y) ** 2 < _ARRIVAL_REACH_SQ:
+                shop = building
+                break
         if shop:
             rng = get_rng("ai_basic")
             duration_sec = roll_duration_seconds("buy_potion", rng)
@@ -194,7 +196,7 @@ def handle_direct_prompt_arrival(ai: Any, hero: Any, task: HeroTask, view: Any)
                 # its mapping arg; hand it the bridge dict carrying the WorldView.
                 dest = resolve_explore_direction_target(
                     hero,
-                    view_to_legacy_context(view),
+                    tick_index.legacy_context(view),
                     dirn,
                     tiles_ahead=_DIRECT_PROMPT_EXPLORE_EXTENSION_TILES,
                 )
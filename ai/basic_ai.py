@@ -5,6 +5,7 @@ Handles routine behavior, defers important decisions to LLM.
 
 from __future__ import annotations
 
+from ai import task_router
 from ai.behaviors import (
     bounty_pursuit,
     defense,
@@ -16,7 +17,9 @@ from ai.behaviors import (
     stuck_recovery,
     support,
 )
+from ai.behaviors import combat, recovery, tick_index
 from ai.behaviors.movement import route_to_building
+from ai.behaviors.view_compat import as_ai_view
 from config import TILE_SIZE
 from game.entities.buildings.types import BuildingType
 from game.entities.hero import HeroState
@@ -45,6 +48,10 @@ _COMMITTED_DESTINATION_TYPES = frozenset({
     "quest_offer",  # WK126-T5: walking to a quest-giver NPC (commit window)
 })
 
+# Squared proximity radii (compared against squared distances; no sqrt per check).
+_SHOP_REACH_SQ = (TILE_SIZE * 2) ** 2
+_REST_LEASH_SQ = (TILE_SIZE * 2) ** 2
+
 # Debug logging (set to True to see AI decision logs).
 DEBUG_AI = False
 
@@ -98,6 +105,15 @@ class BasicAI:
         self.support_behavior = support
         self._hunger_no_stand_logged_heroes: set[str] = set()
 
+    @property
+    def debug_enabled(self) -> bool:
+        """``DEBUG_AI`` as seen by behaviours (read live, so flipping it works).
+
+        Per-tick call sites check this before building their f-string message,
+        so with logging off they skip the formatting, not just the print.
+        """
+        return DEBUG_AI
+
     # -----------------------
     # Intent + decision helpers
     # -----------------------
@@ -192,15 +208,19 @@ class BasicAI:
         ``SimEngine.build_ai_view`` — NOT the live UI ``game_state`` dict. The AI
         no longer holds ``world``/``economy``/``sim``/``engine``; it reads the
         typed view (``view.world`` is a read-only ``WorldView``).
+
+        The view is normalized once for the whole batch, so a legacy dict caller
+        gets one adapter shared by every hero rather than one per hero.
         """
+        view = as_ai_view(view)
+        update_hero = self.update_hero
         for hero in heroes:
             if not hero.is_alive:
                 continue
-            self.update_hero(hero, dt, view)
+            update_hero(hero, dt, view)
 
     def update_hero(self, hero, dt: float, view):
         """Update AI for a single hero."""
-        from ai import task_router
         return task_router.update_hero(self, hero, dt, view)
 
     def handle_idle(self, hero, view):
@@ -210,30 +230,25 @@ class BasicAI:
         self.bounty_behavior.handle_moving(self, hero, view)
 
     def handle_fighting(self, hero, view):
-        from ai.behaviors import combat
         return combat.handle_fighting(self, hero, view)
 
     def handle_retreating(self, hero, view):
-        from ai.behaviors import recovery
         return recovery.handle_retreating(self, hero, view)
 
     def _finalize_deferred_task(self, hero, view):
-        from ai.behaviors import recovery
         return recovery.finalize_deferred_task(self, hero, view)
 
     def handle_shopping(self, hero, view):
         """Handle shopping state - wait inside or buy at marketplace/blacksmith (WK11: deferred purchase on exit)."""
         if hero.is_inside_building:
             return  # Wait for inside_timer to expire; finalize_deferred_task runs on pop-out
-        buildings = view.buildings
-
         shop = None
-        for building in buildings:
-            if building.building_type in ["marketplace", "blacksmith"]:
-                dist = hero.distance_to(building.center_x, building.center_y)
-                if dist < TILE_SIZE * 2:
-                    shop = building
-                    break
+        for building in tick_index.buildings_of_type(view, "marketplace", "blacksmith"):
+            dx = hero.x - building.center_x
+            dy = hero.y - building.center_y
+            if dx * dx + dy * dy < _SHOP_REACH_SQ:
+                shop = building
+                break
 
         if not shop:
             hero.state = HeroState.IDLE
@@ -250,11 +265,13 @@ class BasicAI:
         world = view.world
 
         # WK11: Prefer Inn when closer than home guild.
-        inns = [b for b in buildings if getattr(b, "building_type", None) == BuildingType.INN and getattr(b, "is_constructed", True)]
+        inns = [b for b in tick_index.buildings_of_type(view, BuildingType.INN) if getattr(b, "is_constructed", True)]
         if inns and hero.home_building:
-            hero_dist_home = hero.distance_to(hero.home_building.center_x, hero.home_building.center_y)
-            closest_inn = min(inns, key=lambda b: hero.distance_to(b.center_x, b.center_y))
-            if hero.distance_to(closest_inn.center_x, closest_inn.center_y) < hero_dist_home:
+            hx, hy = hero.x, hero.y
+            home = hero.home_building
+            home_d2 = (hx - home.center_x) ** 2 + (hy - home.center_y) ** 2
+            closest_inn = min(inns, key=lambda b: (hx - b.center_x) ** 2 + (hy - b.center_y) ** 2)
+            if (hx - closest_inn.center_x) ** 2 + (hy - closest_inn.center_y) ** 2 < home_d2:
                 route_to_building(hero, world, buildings, closest_inn)
                 hero.state = HeroState.MOVING
                 hero.target = {"type": "rest_inn", "inn": closest_inn}
@@ -273,8 +290,9 @@ class BasicAI:
             return
 
         if rest_building:
-            dist = hero.distance_to(rest_building.center_x, rest_building.center_y)
-            if dist > TILE_SIZE * 2:
+            dx = hero.x - rest_building.center_x
+            dy = hero.y - rest_building.center_y
+            if dx * dx + dy * dy > _REST_LEASH_SQ:
                 hero.finish_resting()
                 return
 
@@ -9,6 +9,7 @@ from . import llm_bridge
 from . import shopping
 from . import stuck_recovery
 from . import support
+from . import tick_index
 from . import view_compat
 from . import zones
 
@@ -22,6 +23,7 @@ __all__ = [
     "shopping",
     "stuck_recovery",
     "support",
+    "tick_index",
     "view_compat",
     "zones",
 ]
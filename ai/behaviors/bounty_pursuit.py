@@ -13,6 +13,7 @@ from game.sim.timebase import now_ms as sim_now_ms
 from game.systems.navigation import best_adjacent_tile
 from game.world import Visibility
 
+from ai.behaviors.tick_index import alive_enemies, bounty_by_id
 from ai.behaviors.view_compat import as_ai_view
 
 # WK64 (audit item 17): the reached-destination arrival dispatch (and its private
@@ -22,6 +23,20 @@ from ai.behaviors.view_compat import as_ai_view
 # is one-way: this module imports dispatch_arrival from there, never the reverse.
 
 
+# score_bounty class biases: hero_class -> (reward_w, dist_w, risk_w); warrior
+# and unknown classes use the defaults. Type bonuses are keyed (class, bounty_type).
+_DEFAULT_BOUNTY_WEIGHTS = (1.0, 1.0, 1.0)
+_CLASS_BOUNTY_WEIGHTS = {
+    "rogue": (1.45, 0.85, 1.05),
+    "wizard": (1.15, 1.05, 1.15),
+    "ranger": (1.05, 0.95, 1.0),
+}
+_CLASS_BOUNTY_TYPE_BONUS = {
+    ("rogue", "explore"): 1.0,
+    ("wizard", "defend_building"): 0.4,
+}
+
+
 def _seed_direct_prompt_explore_bearing(hero: Any) -> None:
     target = getattr(hero, "target", None)
     if not isinstance(target, dict) or target.get("type") != DIRECT_PROMPT_TARGET_TYPE:
@@ -38,8 +53,14 @@ def _seed_direct_prompt_explore_bearing(hero: Any) -> None:
         hero._dp_explore_bearing_ready = True
 
 
-def _resolve_bounty_from_target(target_dict: dict[str, Any], bounties: list[Any]) -> Any | None:
-    """Find the bounty referenced by ``hero.target`` dict."""
+def _resolve_bounty_from_target(
+    target_dict: dict[str, Any], bounties: list[Any], by_id: dict | None = None
+) -> Any | None:
+    """Find the bounty referenced by ``hero.target`` dict.
+
+    ``by_id`` is the tick's :func:`~ai.behaviors.tick_index.bounty_by_id` map
+    for ``bounties``; without it the list is scanned.
+    """
     bid = target_dict.get("bounty_id")
     if bid is None:
         # Fallback: stored direct reference (best-effort)
@@ -47,6 +68,8 @@ def _resolve_bounty_from_target(target_dict: dict[str, Any], bounties: list[Any]
         if ref in bounties:
             return ref
         return None
+    if by_id is not None:
+        return by_id.get(bid)
     for bounty in bounties:
         if getattr(bounty, "bounty_id", None) == bid:
             return bounty
@@ -66,10 +89,10 @@ def bounty_commitment_active(hero: Any, view: Any, *, now_ms: int | None = None)
     target = getattr(hero, "target", None)
     if not isinstance(target, dict) or target.get("type") != "bounty":
         return False
-    bounty = _resolve_bounty_from_target(target, list(view.bounties or []))
+    bounty = _resolve_bounty_from_target(target, view.bounties or (), bounty_by_id(view))
     if bounty is None:
         return False
-    buildings = list(view.buildings or [])
+    buildings = view.buildings or ()
     if getattr(bounty, "claimed", False):
         return False
     if hasattr(bounty, "is_valid") and not bounty.is_valid(buildings):
@@ -86,10 +109,10 @@ def resume_committed_bounty(ai: Any, hero: Any, view: Any) -> bool:
     target = getattr(hero, "target", None)
     if not isinstance(target, dict) or target.get("type") != "bounty":
         return False
-    bounty = _resolve_bounty_from_target(target, list(view.bounties or []))
+    bounty = _resolve_bounty_from_target(target, view.bounties or (), bounty_by_id(view))
     if bounty is None:
         return False
-    buildings = list(view.buildings or [])
+    buildings = view.buildings or ()
     world = view.world
     goal_x, goal_y = (float(getattr(bounty, "x", hero.x)), float(getattr(bounty, "y", hero.y)))
     if hasattr(bounty, "get_goal_position"):
@@ -138,7 +161,9 @@ def maybe_take_bounty(ai: Any, hero: Any, view: Any) -> bool:
         return False
 
     buildings = view.buildings
-    enemies = view.enemies
+    # Risk estimates only count living enemies; share the tick's filtered list.
+    enemies = alive_enemies(view)
+    world = view.world
 
     best = None
     best_score = -1e9
@@ -151,7 +176,6 @@ def maybe_take_bounty(ai: Any, hero: Any, view: Any) -> bool:
         if hasattr(bounty, "is_valid") and not bounty.is_valid(buildings):
             continue
 
-        world = view.world
         score = score_bounty(ai, hero, bounty, buildings, enemies, world=world)
         if score > best_score:
             best_score = score
@@ -205,33 +229,8 @@ def score_bounty(
 
     # Class bias tuning (prototype).
     cls = getattr(hero, "hero_class", "warrior")
-    reward_w = 1.0
-    dist_w = 1.0
-    risk_w = 1.0
-    type_bonus = 0.0
-
-    if cls == "rogue":
-        reward_w = 1.45
-        dist_w = 0.85
-        risk_w = 1.05
-    elif cls == "wizard":
-        reward_w = 1.15
-        dist_w = 1.05
-        risk_w = 1.15
-    elif cls == "ranger":
-        reward_w = 1.05
-        dist_w = 0.95
-        risk_w = 1.0
-    else:  # warrior and others
-        reward_w = 1.0
-        dist_w = 1.0
-        risk_w = 1.0
-
-    btype = getattr(bounty, "bounty_type", "explore")
-    if cls == "rogue" and btype == "explore":
-        type_bonus += 1.0
-    if cls == "wizard" and btype == "defend_building":
-        type_bonus += 0.4
+    reward_w, dist_w, risk_w = _CLASS_BOUNTY_WEIGHTS.get(cls, _DEFAULT_BOUNTY_WEIGHTS)
+    type_bonus = _CLASS_BOUNTY_TYPE_BONUS.get((cls, getattr(bounty, "bounty_type", "explore")), 0.0)
 
     # WK6: Apply black fog distance penalty (uncertainty multiplier).
     effective_dist_tiles = dist_tiles * (
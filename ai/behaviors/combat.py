@@ -30,20 +30,25 @@ def handle_fighting(ai: "BasicAI", hero, view) -> None:
     # Check if target is still valid.
     # WK61-FIX: Buildings now have is_alive (WK61-BUG-003). Only fight enemies
     # or lairs; if target is a non-lair building, drop it immediately.
-    if hero.target and hasattr(hero.target, "is_alive"):
-        if hasattr(hero.target, "building_type") and not getattr(hero.target, "is_lair", False):
+    # The target is read once: every branch that reassigns ``hero.target`` returns.
+    target = hero.target
+    if target and hasattr(target, "is_alive"):
+        if hasattr(target, "building_type") and not getattr(target, "is_lair", False):
             # Non-lair building target in FIGHTING state is invalid — go idle.
             hero.target = None
             hero.state = HeroState.IDLE
             return
-        if not hero.target.is_alive:
+        if not target.is_alive:
             hero.target = None
             hero.state = HeroState.IDLE
             return
 
         # Check if target in range.
-        dist = hero.distance_to(hero.target.x, hero.target.y)
-        if dist > hero.attack_range:
+        target_x, target_y = target.x, target.y
+        dx = hero.x - target_x
+        dy = hero.y - target_y
+        attack_range = hero.attack_range
+        if dx * dx + dy * dy > attack_range * attack_range:
             # Move towards target (for lairs/buildings, approach adjacent tile to avoid unreachable goals).
             buildings = view.buildings
             world = view.world
@@ -57,22 +62,22 @@ def handle_fighting(ai: "BasicAI", hero, view) -> None:
                 ogx, ogy = world.world_to_grid(prev[0], prev[1])
                 return (ngx, ngy) == (ogx, ogy)
 
-            if getattr(hero.target, "is_lair", False):
+            if getattr(target, "is_lair", False):
                 if world:
-                    adj = best_adjacent_tile(world, buildings, hero.target, hero.x, hero.y)
+                    adj = best_adjacent_tile(world, buildings, target, hero.x, hero.y)
                     if adj:
                         new_tx = adj[0] * TILE_SIZE + TILE_SIZE / 2
                         new_ty = adj[1] * TILE_SIZE + TILE_SIZE / 2
                     else:
-                        new_tx, new_ty = hero.target.x, hero.target.y
+                        new_tx, new_ty = target_x, target_y
                 else:
-                    new_tx, new_ty = hero.target.x, hero.target.y
+                    new_tx, new_ty = target_x, target_y
                 if _chase_goal_unchanged(new_tx, new_ty):
                     hero.state = HeroState.MOVING
                     return
                 hero.target_position = (new_tx, new_ty)
             else:
-                new_tx, new_ty = hero.target.x, hero.target.y
+                new_tx, new_ty = target_x, target_y
                 if _chase_goal_unchanged(new_tx, new_ty):
                     hero.state = HeroState.MOVING
                     return
@@ -18,8 +18,10 @@ from game.entities.hero import HeroState
 from game.sim.timebase import now_ms as sim_now_ms
 from game.systems.navigation import best_adjacent_tile
 
+from ai.behaviors import bounty_pursuit
 from ai.behaviors.movement import route_to_building
 from ai.behaviors.poi_awareness import score_poi_for_personality
+from ai.behaviors.tick_index import alive_enemies, view_tick_memo
 from ai.behaviors.view_compat import as_ai_view
 
 
@@ -313,15 +315,17 @@ def build_daily_life_candidates(ai: Any, hero: Any, view: Any, *, now_ms: int |
     buildings = list(getattr(view, "buildings", ()) or ())
     heroes = list(getattr(view, "heroes", ()) or ())
     pois = list(getattr(view, "pois", ()) or ())
-    enemies = [e for e in (getattr(view, "enemies", ()) or ()) if getattr(e, "is_alive", False)]
+    enemies = alive_enemies(view)
     boss_encounters = list(getattr(view, "boss_encounters", ()) or ())
     world = getattr(view, "world", None)
     castle = getattr(view, "castle", None)
     home = getattr(hero, "home_building", None)
 
+    pools = _ambient_building_pools(view, buildings)
+
     candidates: list[AmbientCandidate] = []
 
-    roam_anchor = _pick_roam_anchor(hero, castle, buildings)
+    roam_anchor = _pick_roam_anchor(hero, castle, pools["roam"])
     if roam_anchor is not None:
         candidates.append(
             _candidate_for_building(
@@ -372,7 +376,7 @@ def build_daily_life_candidates(ai: Any, hero: Any, view: Any, *, now_ms: int |
             )
         )
 
-    monster = _pick_monster_patrol_target(hero, enemies, buildings, boss_encounters)
+    monster = _pick_monster_patrol_target(hero, enemies, pools["lairs"], boss_encounters)
     if monster is not None:
         mx, my = _target_center(monster)
         d_tiles = _distance_tiles(hero, mx, my)
@@ -453,7 +457,7 @@ def build_daily_life_candidates(ai: Any, hero: Any, view: Any, *, now_ms: int |
             )
         )
 
-    rest_target, rest_primitive = _pick_safe_rest_target(hero, castle, home, buildings)
+    rest_target, rest_primitive = _pick_safe_rest_target(hero, castle, home, pools["rest"])
     if rest_target is not None:
         rx, ry = _target_center(rest_target)
         d_tiles = _distance_tiles(hero, rx, ry)
@@ -478,7 +482,7 @@ def build_daily_life_candidates(ai: Any, hero: Any, view: Any, *, now_ms: int |
             )
         )
 
-    social_target = _pick_social_target(hero, buildings)
+    social_target = _pick_social_target(hero, pools["social"])
     if social_target is not None:
         sx, sy = _target_center(social_target)
         d_tiles = _distance_tiles(hero, sx, sy)
@@ -500,7 +504,7 @@ def build_daily_life_candidates(ai: Any, hero: Any, view: Any, *, now_ms: int |
             )
         )
 
-    opportunity_target = _pick_opportunity_target(hero, buildings, view)
+    opportunity_target = _pick_opportunity_target(hero, pools["opportunity"])
     if opportunity_target is not None:
         ox, oy = _target_center(opportunity_target)
         d_tiles = _distance_tiles(hero, ox, oy)
@@ -524,7 +528,7 @@ def build_daily_life_candidates(ai: Any, hero: Any, view: Any, *, now_ms: int |
             )
         )
 
-    home_target = _pick_home_or_guild_target(hero, buildings, home)
+    home_target = _pick_home_or_guild_target(hero, pools["by_slug"], home)
     if home_target is not None:
         hx, hy = _target_center(home_target)
         d_tiles = _distance_tiles(hero, hx, hy)
@@ -546,7 +550,7 @@ def build_daily_life_candidates(ai: Any, hero: Any, view: Any, *, now_ms: int |
             )
         )
 
-    road_target = _pick_road_watch_point(hero, castle, buildings)
+    road_target = _pick_road_watch_point(hero, castle, roam_anchor)
     if road_target is not None:
         rx, ry = road_target
         d_tiles = _distance_tiles(hero, rx, ry)
@@ -825,8 +829,6 @@ def try_daily_life(ai: Any, hero: Any, view: Any) -> bool:
     # Never step on live bounty commitments.
     if getattr(hero, "target", None) and isinstance(getattr(hero, "target", None), dict):
         if getattr(hero.target, "get", lambda *_: None)("type") == "bounty":
-            from ai.behaviors import bounty_pursuit
-
             if bounty_pursuit.bounty_commitment_active(hero, view, now_ms=now_ms):
                 return False
 
@@ -1193,8 +1195,7 @@ def _pick_best_matching_entity(hero: Any, candidates: list[Any], labels: set[str
         scored.append((_distance_tiles(hero, x, y), _entity_key("story", entity), entity))
     if not scored:
         return None
-    scored.sort(key=lambda row: (row[0], row[1]))
-    return scored[0][2]
+    return min(scored, key=lambda row: (row[0], row[1]))[2]
 
 
 def _resolve_rescue_target(
@@ -1283,36 +1284,103 @@ def _candidate_for_building(
     )
 
 
-def _pick_roam_anchor(hero: Any, castle: Any, buildings: list[Any]) -> Any | None:
+# Building-type pools for the ambient pickers below.
+_ROAM_ANCHOR_SLUGS = frozenset({
+    "inn",
+    "marketplace",
+    "blacksmith",
+    "trading_post",
+    "warrior_guild",
+    "ranger_guild",
+    "rogue_guild",
+    "wizard_guild",
+    "temple",
+    "temple_agrela",
+    "temple_dauros",
+    "temple_fervus",
+    "temple_krypta",
+    "temple_krolm",
+    "temple_helia",
+    "temple_lunord",
+    "guardhouse",
+    "palace",
+    "house",
+    "farm",
+    "food_stand",
+    "herald_post",
+})
+_SAFE_REST_SLUGS = frozenset({
+    "castle",
+    "inn",
+    "house",
+    "temple",
+    "temple_agrela",
+    "temple_dauros",
+    "temple_fervus",
+    "temple_krypta",
+    "temple_krolm",
+    "temple_helia",
+    "temple_lunord",
+})
+_SOCIAL_SLUGS = frozenset({
+    "inn", "castle", "marketplace", "trading_post", "warrior_guild", "ranger_guild", "rogue_guild", "wizard_guild",
+})
+_OPPORTUNITY_SLUGS = frozenset({"castle", "herald_post", "marketplace", "blacksmith", "trading_post"})
+
+
+def _is_safe_rest_building(building: Any) -> bool:
+    return _building_slug(building) in _SAFE_REST_SLUGS and not getattr(building, "is_under_attack", False)
+
+
+def _ambient_building_pools(view: Any, buildings: list[Any]) -> dict:
+    """Hero-independent building prefilters for the ambient pickers, in view order.
+
+    Building types, lair HP and ``is_under_attack`` do not change during the AI
+    pass, so one pass over ``buildings`` per tick serves every hero's
+    ``build_daily_life_candidates`` (memoized on the view; see ``tick_index``).
+    """
+    memo = view_tick_memo(view)
+    if memo is not None:
+        pools = memo.get("daily_life_pools")
+        if pools is not None:
+            return pools
+    roam: list[Any] = []
+    lairs: list[Any] = []
+    rest: list[Any] = []
+    social: list[Any] = []
+    opportunity: list[Any] = []
+    by_slug: dict[str, list[Any]] = {}
+    for building in buildings:
+        slug = _building_slug(building)
+        by_slug.setdefault(slug, []).append(building)
+        if slug in _ROAM_ANCHOR_SLUGS:
+            roam.append(building)
+        if getattr(building, "is_lair", False) and int(getattr(building, "hp", 0) or 0) > 0:
+            lairs.append(building)
+        if getattr(building, "is_under_attack", False):
+            continue
+        if slug in _SAFE_REST_SLUGS:
+            rest.append(building)
+        if slug in _SOCIAL_SLUGS:
+            social.append(building)
+        if slug in _OPPORTUNITY_SLUGS:
+            opportunity.append(building)
+    pools = {
+        "roam": tuple(roam),
+        "lairs": tuple(lairs),
+        "rest": tuple(rest),
+        "social": tuple(social),
+        "opportunity": tuple(opportunity),
+        "by_slug": {slug: tuple(group) for slug, group in by_slug.items()},
+    }
+    if memo is not None:
+        memo["daily_life_pools"] = pools
+    return pools
+
+
+def _pick_roam_anchor(hero: Any, castle: Any, roam_buildings: tuple) -> Any | None:
     anchors = [castle] if castle is not None else []
-    anchors.extend(
-        b
-        for b in buildings
-        if _building_slug(b) in {
-            "inn",
-            "marketplace",
-            "blacksmith",
-            "trading_post",
-            "warrior_guild",
-            "ranger_guild",
-            "rogue_guild",
-            "wizard_guild",
-            "temple",
-            "temple_agrela",
-            "temple_dauros",
-            "temple_fervus",
-            "temple_krypta",
-            "temple_krolm",
-            "temple_helia",
-            "temple_lunord",
-            "guardhouse",
-            "palace",
-            "house",
-            "farm",
-            "food_stand",
-            "herald_post",
-        }
-    )
+    anchors.extend(roam_buildings)
     if not anchors:
         return None
     return _pick_best_by_score(hero, anchors, motive="kingdom_roam")
@@ -1326,8 +1394,7 @@ def _pick_frontier(hero: Any, world: Any) -> tuple[int, int] | None:
     frontier = exploration._find_black_fog_frontier_tiles(world, hero, max_candidates=6)
     if not frontier:
         return None
-    frontier.sort(key=lambda row: (-row[2], row[1], row[0]))
-    gx, gy, _ = frontier[0]
+    gx, gy, _ = min(frontier, key=lambda row: (-row[2], row[1], row[0]))
     return (int(gx), int(gy))
 
 
@@ -1345,30 +1412,25 @@ def _pick_poi(hero: Any, pois: list[Any]) -> Any | None:
         scored.append((float(score), _entity_key("poi", poi), poi))
     if not scored:
         return None
-    scored.sort(key=lambda row: (-row[0], row[1]))
-    return scored[0][2]
+    return min(scored, key=lambda row: (-row[0], row[1]))[2]
 
 
 def _pick_monster_patrol_target(
     hero: Any,
     enemies: list[Any],
-    buildings: list[Any],
+    lairs: tuple,
     boss_encounters: list[Any],
 ) -> Any | None:
     scored: list[tuple[float, str, Any]] = []
+    # ``enemies`` is the tick's pre-filtered living list (``alive_enemies``).
     for enemy in enemies:
-        if not getattr(enemy, "is_alive", False):
-            continue
         dist = _distance_tiles(hero, float(getattr(enemy, "x", 0.0)), float(getattr(enemy, "y", 0.0)))
         if dist < 5.0:
             continue
         score = 20.0 + max(0.0, 16.0 - abs(dist - 8.0))
         scored.append((score, _entity_key("enemy", enemy), enemy))
-    for building in buildings:
-        if not getattr(building, "is_lair", False):
-            continue
-        if int(getattr(building, "hp", 0) or 0) <= 0:
-            continue
+    # ``lairs`` is the tick's living-lair pool (``_ambient_building_pools``).
+    for building in lairs:
         dist = _distance_tiles(hero, float(getattr(building, "center_x", 0.0)), float(getattr(building, "center_y", 0.0)))
         score = 18.0 + max(0.0, 16.0 - abs(dist - 10.0))
         scored.append((score, _entity_key("lair", building), building))
@@ -1383,31 +1445,14 @@ def _pick_monster_patrol_target(
         scored.append((score, _entity_key("boss", boss), boss))
     if not scored:
         return None
-    scored.sort(key=lambda row: (-row[0], row[1]))
-    return scored[0][2]
+    return min(scored, key=lambda row: (-row[0], row[1]))[2]
 
 
-def _pick_safe_rest_target(hero: Any, castle: Any, home: Any, buildings: list[Any]) -> tuple[Any | None, str]:
-    candidates = [b for b in (home, castle, *buildings) if b is not None]
+def _pick_safe_rest_target(hero: Any, castle: Any, home: Any, rest_buildings: tuple) -> tuple[Any | None, str]:
+    candidates = [b for b in (home, castle) if b is not None and _is_safe_rest_building(b)]
+    candidates.extend(rest_buildings)
     scored: list[tuple[float, str, Any]] = []
     for building in candidates:
-        slug = _building_slug(building)
-        if slug not in {
-            "castle",
-            "inn",
-            "house",
-            "temple",
-            "temple_agrela",
-            "temple_dauros",
-            "temple_fervus",
-            "temple_krypta",
-            "temple_krolm",
-            "temple_helia",
-            "temple_lunord",
-        }:
-            continue
-        if getattr(building, "is_under_attack", False):
-            continue
         dist = _distance_tiles(hero, float(getattr(building, "center_x", 0.0)), float(getattr(building, "center_y", 0.0)))
         hp_pct = float(getattr(hero, "health_percent", 1.0) or 1.0)
         score = 10.0 + max(0.0, 16.0 - dist)
@@ -1416,55 +1461,38 @@ def _pick_safe_rest_target(hero: Any, castle: Any, home: Any, buildings: list[An
         scored.append((score, _entity_key("rest", building), building))
     if not scored:
         return (None, "")
-    scored.sort(key=lambda row: (-row[0], row[1]))
-    target = scored[0][2]
+    target = min(scored, key=lambda row: (-row[0], row[1]))[2]
     slug = _building_slug(target)
     return (target, "rest_inn" if slug == "inn" else "going_home")
 
 
-def _pick_social_target(hero: Any, buildings: list[Any]) -> Any | None:
-    candidates = []
-    for building in buildings:
-        slug = _building_slug(building)
-        if slug not in {"inn", "castle", "marketplace", "trading_post", "warrior_guild", "ranger_guild", "rogue_guild", "wizard_guild"}:
-            continue
-        if getattr(building, "is_under_attack", False):
-            continue
-        candidates.append(building)
-    if not candidates:
+def _pick_social_target(hero: Any, social_buildings: tuple) -> Any | None:
+    if not social_buildings:
         return None
-    return _pick_best_by_score(hero, candidates, motive="social_linger")
+    return _pick_best_by_score(hero, social_buildings, motive="social_linger")
 
 
-def _pick_opportunity_target(hero: Any, buildings: list[Any], view: Any) -> Any | None:
-    candidates = []
-    for building in buildings:
-        slug = _building_slug(building)
-        if slug not in {"castle", "herald_post", "marketplace", "blacksmith", "trading_post"}:
-            continue
-        if getattr(building, "is_under_attack", False):
-            continue
-        candidates.append(building)
-    if not candidates:
+def _pick_opportunity_target(hero: Any, opportunity_buildings: tuple) -> Any | None:
+    if not opportunity_buildings:
         return None
-    return _pick_best_by_score(hero, candidates, motive="opportunity_check")
+    return _pick_best_by_score(hero, opportunity_buildings, motive="opportunity_check")
 
 
-def _pick_home_or_guild_target(hero: Any, buildings: list[Any], home: Any) -> Any | None:
+def _pick_home_or_guild_target(hero: Any, buildings_by_slug: dict, home: Any) -> Any | None:
     if home is not None:
         return home
     class_slug = str(getattr(hero, "hero_class", "") or "").lower()
     guild_slug = f"{class_slug}_guild" if class_slug else ""
-    candidates = [b for b in buildings if _building_slug(b) == guild_slug]
+    candidates = buildings_by_slug.get(guild_slug)
     if not candidates:
         return None
     return _pick_best_by_score(hero, candidates, motive="home_or_guild_time")
 
 
-def _pick_road_watch_point(hero: Any, castle: Any, buildings: list[Any]) -> tuple[float, float] | None:
+def _pick_road_watch_point(hero: Any, castle: Any, target: Any) -> tuple[float, float] | None:
+    """Waypoint between the castle and ``target`` (the hero's kingdom-roam anchor)."""
     if castle is None:
         return None
-    target = _pick_roam_anchor(hero, castle, buildings)
     if target is None:
         return (float(getattr(castle, "center_x", 0.0)), float(getattr(castle, "center_y", 0.0)))
     cx = float(getattr(castle, "center_x", 0.0))
@@ -1495,8 +1523,7 @@ def _pick_best_by_score(hero: Any, items: list[Any], *, motive: str) -> Any | No
         scored.append((score, _entity_key("target", item), item))
     if not scored:
         return None
-    scored.sort(key=lambda row: (-row[0], row[1]))
-    return scored[0][2]
+    return min(scored, key=lambda row: (-row[0], row[1]))[2]
 
 
 def _crowding_penalty(candidate: AmbientCandidate, hero: Any, view: Any) -> float:
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import os
 from typing import Any
 
 from config import TILE_SIZE
@@ -10,6 +9,8 @@ from game.entities.hero import HeroState
 from game.sim.hero_guardrails_tunables import TARGET_COMMIT_WINDOW_S
 from game.sim.timebase import now_ms as sim_now_ms
 
+from ai.behaviors import tick_index
+from ai.behaviors.tick_index import view_tick_memo as _view_tick_memo
 from ai.behaviors.view_compat import as_ai_view
 
 # Mythos S5 (ai-threat-cache-staggered, memo half): hero-INDEPENDENT threat
@@ -21,25 +22,15 @@ from ai.behaviors.view_compat import as_ai_view
 # threat state does not mutate during the AI pass (combat/damage runs later in
 # the tick), so the memoized value == a fresh scan at every decision point —
 # exact equivalence, WK67 digest byte-identical (pinned by
-# tests/test_mythos_sim_tick.py). Views that cannot host the memo (the
-# slots-based legacy-dict adapter used by observe_sync/direct-prompt) silently
-# fall back to uncached scans. KINGDOM_AI_THREAT_MEMO=0 disables (A/B hatch).
-_THREAT_MEMO_ENABLED = os.environ.get("KINGDOM_AI_THREAT_MEMO", "1") != "0"
-
-
-def _view_tick_memo(view: Any) -> dict | None:
-    """Per-tick memo dict hosted on the AI view, or None when not memoizable."""
-    if not _THREAT_MEMO_ENABLED:
-        return None
-    memo = getattr(view, "_mythos_tick_memo", None)
-    if memo is None:
-        memo = {}
-        try:
-            # AiGameView is a frozen dataclass — bypass its setattr guard.
-            object.__setattr__(view, "_mythos_tick_memo", memo)
-        except (AttributeError, TypeError):
-            return None  # slots-based adapter (legacy dict path): no caching
-    return memo
+# tests/test_mythos_sim_tick.py). The memo itself now lives in
+# ``ai.behaviors.tick_index`` (shared with the per-tick enemy grid).
+
+# Squared radii for the defend_* proximity checks (compared against squared
+# distances; no sqrt).
+_HOME_GUARD_RADIUS = TILE_SIZE * 5
+_HOME_GUARD_SQ = _HOME_GUARD_RADIUS * _HOME_GUARD_RADIUS
+_HOME_LEASH_SQ = (TILE_SIZE * 2) ** 2
+_CASTLE_LEASH_SQ = (TILE_SIZE * 3) ** 2
 
 
 def _commit_until_ms(now_ms: int) -> int:
@@ -75,6 +66,18 @@ def engage(
         hero.set_target_position(enemy.x, enemy.y)
 
 
+def engage_or_chase(hero: Any, enemy: Any, now_ms: int) -> None:
+    """Fight ``enemy`` if it is in attack range, else chase it (``MOVING``).
+
+    The shared tail of the castle / neutral / economic building responders.
+    """
+    if _in_attack_range(hero, enemy):
+        engage(hero, enemy, now_ms, set_fighting=True, set_position=False)
+        return
+    engage(hero, enemy, now_ms)
+    hero.state = HeroState.MOVING
+
+
 def building_threatened(view: Any, building: Any, radius_tiles: int) -> bool:
     """True iff ``building`` faces an ACTUAL threat: recently damaged
     (``is_under_attack``, the 3 s window that exists to prevent permanent
@@ -102,19 +105,81 @@ def _building_threatened_scan(view: Any, building: Any, radius_tiles: int) -> bo
     if getattr(building, "is_under_attack", False):
         return True
     radius = TILE_SIZE * radius_tiles
+    radius_sq = radius * radius
     cx, cy = building.center_x, building.center_y
-    for enemy in view.enemies:
-        if getattr(enemy, "is_alive", False) and enemy.distance_to(cx, cy) < radius:
+    for _order, enemy in tick_index.enemy_grid(view).candidates(cx, cy, radius):
+        if (enemy.x - cx) ** 2 + (enemy.y - cy) ** 2 < radius_sq:
             return True
     return False
 
 
+def _in_attack_range(hero: Any, target: Any) -> bool:
+    """``hero.distance_to(target) <= hero.attack_range``, compared squared."""
+    dx = hero.x - target.x
+    dy = hero.y - target.y
+    attack_range = hero.attack_range
+    return dx * dx + dy * dy <= attack_range * attack_range
+
+
+def _nearest_building_within(hero: Any, buildings: Any, radius: float) -> Any:
+    """Building in ``buildings`` nearest the hero within ``radius`` (inclusive), or None.
+
+    First building in list order wins ties.
+    """
+    hx, hy = hero.x, hero.y
+    best = None
+    best_d2 = float("inf")
+    radius_sq = radius * radius
+    for building in buildings:
+        d2 = (hx - building.center_x) ** 2 + (hy - building.center_y) ** 2
+        if d2 <= radius_sq and d2 < best_d2:
+            best = building
+            best_d2 = d2
+    return best
+
+
+def _nearest_enemy_to_building(view: Any, building: Any) -> Any:
+    """Living enemy nearest ``building``'s center (no radius), or None.
+
+    Hero-independent, so memoized per tick per building: every hero answering
+    a castle threat shares one SoA scan.
+    """
+    memo = _view_tick_memo(view)
+    key = ("nearest_enemy_to", id(building))
+    if memo is not None and key in memo:
+        return memo[key]
+    enemy, _dist = tick_index.nearest_enemy(view, building.center_x, building.center_y)
+    if memo is not None:
+        memo[key] = enemy
+    return enemy
+
+
+def _enemies_guarding_building(view: Any, building: Any) -> tuple:
+    """``(enemy, x, y)`` for living enemies strictly within the home-guard
+    radius of ``building``, in view order (memoized per tick per building)."""
+    memo = _view_tick_memo(view)
+    key = ("enemies_guarding", id(building))
+    if memo is not None:
+        hit = memo.get(key)
+        if hit is not None:
+            return hit
+    bx, by = building.center_x, building.center_y
+    out = []
+    for _order, enemy in tick_index.enemy_grid(view).candidates(bx, by, _HOME_GUARD_RADIUS):
+        ex, ey = enemy.x, enemy.y
+        if (ex - bx) ** 2 + (ey - by) ** 2 < _HOME_GUARD_SQ:
+            out.append((enemy, ex, ey))
+    hit = tuple(out)
+    if memo is not None:
+        memo[key] = hit
+    return hit
+
+
 def defend_castle(ai: Any, hero: Any, view: Any, castle: Any) -> None:
     """Send hero to defend the castle when it is threatened (recently damaged
     or a live enemy nearby — see ``building_threatened``; WK127-T1 dropped the
     old chip-damage gate)."""
     view = as_ai_view(view)
-    enemies = view.enemies
 
     # WK2 anti-oscillation: if currently committed to a valid combat target, don't thrash.
     now_ms = int(sim_now_ms())
@@ -123,26 +188,14 @@ def defend_castle(ai: Any, hero: Any, view: Any, castle: Any) -> None:
         if cur is not None and hasattr(cur, "is_alive") and getattr(cur, "is_alive", False):
             return
 
-    target_enemy = None
-    target_dist = float("inf")
-    for enemy in enemies:
-        if enemy.is_alive:
-            dist_to_castle = enemy.distance_to(castle.center_x, castle.center_y)
-            if dist_to_castle < target_dist:
-                target_dist = dist_to_castle
-                target_enemy = enemy
+    # Nearest living enemy to the castle (hero-independent; once per tick).
+    target_enemy = _nearest_enemy_to_building(view, castle)
 
     if target_enemy:
-        dist_to_hero = hero.distance_to(target_enemy.x, target_enemy.y)
-        if dist_to_hero <= hero.attack_range:
-            engage(hero, target_enemy, now_ms, set_fighting=True, set_position=False)
-            return
-        engage(hero, target_enemy, now_ms)
-        hero.state = HeroState.MOVING
+        engage_or_chase(hero, target_enemy, now_ms)
         return
 
-    dist_to_castle = hero.distance_to(castle.center_x, castle.center_y)
-    if dist_to_castle > TILE_SIZE * 3:
+    if (hero.x - castle.center_x) ** 2 + (hero.y - castle.center_y) ** 2 > _CASTLE_LEASH_SQ:
         hero.target = {"type": "defend_castle"}
         hero.set_target_position(castle.center_x + TILE_SIZE, castle.center_y)
         hero.state = HeroState.MOVING
@@ -155,7 +208,6 @@ def defend_home_building(ai: Any, hero: Any, view: Any) -> None:
     enemy nearby — see ``building_threatened``; WK127-T1 dropped the old
     chip-damage gate)."""
     view = as_ai_view(view)
-    enemies = view.enemies
 
     # WK2 anti-oscillation: if currently committed to a valid combat target, don't thrash.
     now_ms = int(sim_now_ms())
@@ -169,26 +221,26 @@ def defend_home_building(ai: Any, hero: Any, view: Any) -> None:
 
     building = hero.home_building
 
+    # Two-stage scan: the enemies within 5 tiles of the building are found once
+    # per tick (shared by every hero homed there), then the one nearest this
+    # hero wins (view order, so first still wins ties, as before).
+    bx, by = building.center_x, building.center_y
+    hx, hy = hero.x, hero.y
     nearest_enemy = None
-    nearest_dist = float("inf")
-
-    for enemy in enemies:
-        if enemy.is_alive:
-            dist_to_building = enemy.distance_to(building.center_x, building.center_y)
-            if dist_to_building < TILE_SIZE * 5:
-                dist_to_hero = hero.distance_to(enemy.x, enemy.y)
-                if dist_to_hero < nearest_dist:
-                    nearest_dist = dist_to_hero
-                    nearest_enemy = enemy
+    nearest_d2 = float("inf")
+    for enemy, ex, ey in _enemies_guarding_building(view, building):
+        d2 = (hx - ex) ** 2 + (hy - ey) ** 2
+        if d2 < nearest_d2:
+            nearest_d2 = d2
+            nearest_enemy = enemy
 
     if nearest_enemy:
-        if nearest_dist <= hero.attack_range:
+        if nearest_d2 <= hero.attack_range * hero.attack_range:
             engage(hero, nearest_enemy, now_ms, set_fighting=True, set_position=False)
         else:
             engage(hero, nearest_enemy, now_ms)
     else:
-        dist_to_home = hero.distance_to(building.center_x, building.center_y)
-        if dist_to_home > TILE_SIZE * 2:
+        if (hx - bx) ** 2 + (hy - by) ** 2 > _HOME_LEASH_SQ:
             hero.set_target_position(building.center_x + TILE_SIZE, building.center_y)
         else:
             hero.state = HeroState.IDLE
@@ -197,6 +249,17 @@ def defend_home_building(ai: Any, hero: Any, view: Any) -> None:
 # WK15: Economic building types warriors prioritize defending (neutral buildings that generate tax).
 ECONOMIC_NEUTRAL_TYPES = ("farm", "food_stand")
 
+# Explicit activities the building-defense responders never interrupt.
+_EXPLICIT_ACTIVITY_TARGET_TYPES = frozenset({"going_home", "shopping"})
+
+# Class-based willingness to respond to an attacked neutral building.
+_NEUTRAL_DEFENSE_WILLINGNESS = {
+    "warrior": 1.0,
+    "ranger": 0.85,
+    "wizard": 0.75,
+    "rogue": 0.55,
+}
+
 
 def _attacked_economic_buildings(view: Any) -> list:
     """Hero-independent prefilter: under-attack economic buildings, in
@@ -245,6 +308,35 @@ def _attacked_neutral_buildings(view: Any) -> list:
     return out
 
 
+def _nearest_enemy_near_building(view: Any, building: Any, radius: float) -> Any:
+    """Living enemy nearest ``building``'s center within ``radius`` (strict), or None.
+
+    Only the per-tick enemy grid cells overlapping ``radius`` are scanned;
+    first enemy in view order wins ties. Hero-independent, so memoized per tick
+    per (building, radius) for the heroes converging on the same building.
+    """
+    memo = _view_tick_memo(view)
+    key = ("nearest_enemy_near", id(building), radius)
+    if memo is not None and key in memo:
+        return memo[key]
+    best = _nearest_enemy_near_building_scan(view, building, radius)
+    if memo is not None:
+        memo[key] = best
+    return best
+
+
+def _nearest_enemy_near_building_scan(view: Any, building: Any, radius: float) -> Any:
+    bx, by = building.center_x, building.center_y
+    best = None
+    best_d2 = radius * radius
+    for _order, enemy in tick_index.enemy_grid(view).candidates(bx, by, radius):
+        d2 = (enemy.x - bx) ** 2 + (enemy.y - by) ** 2
+        if d2 < best_d2:
+            best = enemy
+            best_d2 = d2
+    return best
+
+
 def defend_economic_building_warrior(ai: Any, hero: Any, view: Any) -> bool:
     """
     Warriors prioritize moving to defend nearby economic buildings (farm, food_stand) under attack.
@@ -252,15 +344,14 @@ def defend_economic_building_warrior(ai: Any, hero: Any, view: Any) -> bool:
     """
     view = as_ai_view(view)
     buildings = view.buildings
-    enemies = view.enemies
 
     if not getattr(hero, "hero_class", "") == "warrior":
         return False
 
     # Don't interrupt explicit activities.
-    if hero.target and isinstance(hero.target, dict):
-        if hero.target.get("type") in ["going_home", "shopping"]:
-            return False
+    target = hero.target
+    if target and isinstance(target, dict) and target.get("type") in _EXPLICIT_ACTIVITY_TARGET_TYPES:
+        return False
 
     now_ms = int(sim_now_ms())
     if now_ms < int(getattr(hero, "_target_commit_until_ms", 0) or 0):
@@ -269,37 +360,18 @@ def defend_economic_building_warrior(ai: Any, hero: Any, view: Any) -> bool:
             return False
 
     visibility_radius = TILE_SIZE * 8
-    candidate = None
-    candidate_dist = float("inf")
     # Mythos S5: the type/hp/under-attack filter is hero-independent — iterate
     # the per-tick prefiltered list (same buildings, same order) and keep only
     # the per-hero distance check here. Result is identical to the full loop.
-    for building in _attacked_economic_buildings(view):
-        dist = hero.distance_to(building.center_x, building.center_y)
-        if dist <= visibility_radius and dist < candidate_dist:
-            candidate = building
-            candidate_dist = dist
+    candidate = _nearest_building_within(hero, _attacked_economic_buildings(view), visibility_radius)
 
     if not candidate:
         return False
 
-    target_enemy = None
-    target_dist = float("inf")
-    for enemy in enemies:
-        if not getattr(enemy, "is_alive", False):
-            continue
-        dist = enemy.distance_to(candidate.center_x, candidate.center_y)
-        if dist < TILE_SIZE * 6 and dist < target_dist:
-            target_enemy = enemy
-            target_dist = dist
+    target_enemy = _nearest_enemy_near_building(view, candidate, TILE_SIZE * 6)
 
     if target_enemy:
-        dist_to_hero = hero.distance_to(target_enemy.x, target_enemy.y)
-        if dist_to_hero <= hero.attack_range:
-            engage(hero, target_enemy, now_ms, set_fighting=True, set_position=False)
-            return True
-        engage(hero, target_enemy, now_ms)
-        hero.state = HeroState.MOVING
+        engage_or_chase(hero, target_enemy, now_ms)
         return True
 
     hero.target = {"type": "defend_neutral", "building": candidate}
@@ -314,13 +386,11 @@ def defend_neutral_building_if_visible(ai: Any, hero: Any, view: Any) -> bool:
     the hero may choose to defend it depending on class.
     """
     view = as_ai_view(view)
-    buildings = view.buildings
-    enemies = view.enemies
 
     # Don't interrupt explicit activities like shopping/going_home.
-    if hero.target and isinstance(hero.target, dict):
-        if hero.target.get("type") in ["going_home", "shopping"]:
-            return False
+    target = hero.target
+    if target and isinstance(target, dict) and target.get("type") in _EXPLICIT_ACTIVITY_TARGET_TYPES:
+        return False
 
     # WK2 anti-oscillation: if currently committed to a valid combat target, don't thrash.
     now_ms = int(sim_now_ms())
@@ -329,54 +399,30 @@ def defend_neutral_building_if_visible(ai: Any, hero: Any, view: Any) -> bool:
         if cur is not None and hasattr(cur, "is_alive") and getattr(cur, "is_alive", False):
             return False
 
-    visibility_radius = TILE_SIZE * 6
-    # Class-based willingness to respond.
-    cls = getattr(hero, "hero_class", "warrior")
-    willingness = {
-        "warrior": 1.0,
-        "ranger": 0.85,
-        "wizard": 0.75,
-        "rogue": 0.55,
-    }.get(cls, 0.8)
-
     # Find closest attacked neutral building within visibility.
     # Mythos S5: the neutral/hp/under-attack filter is hero-independent —
     # iterate the per-tick prefiltered list (same buildings, same order) and
     # keep only the per-hero distance check here. Identical result; the RNG
     # willingness draw below still happens only when a candidate is found.
-    candidate = None
-    candidate_dist = float("inf")
-    for building in _attacked_neutral_buildings(view):
-        dist = hero.distance_to(building.center_x, building.center_y)
-        if dist <= visibility_radius and dist < candidate_dist:
-            candidate = building
-            candidate_dist = dist
+    # The list is empty on almost every tick, so that case returns first.
+    attacked = _attacked_neutral_buildings(view)
+    if not attacked:
+        return False
+    candidate = _nearest_building_within(hero, attacked, TILE_SIZE * 6)
 
     if not candidate:
         return False
+    willingness = _NEUTRAL_DEFENSE_WILLINGNESS.get(getattr(hero, "hero_class", "warrior"), 0.8)
 
     # Stochastic willingness (keeps behavior varied and class-flavored).
     if ai._ai_rng.random() > float(willingness):
         return False
 
     # Find nearest enemy near that building.
-    target_enemy = None
-    target_dist = float("inf")
-    for enemy in enemies:
-        if not getattr(enemy, "is_alive", False):
-            continue
-        dist = enemy.distance_to(candidate.center_x, candidate.center_y)
-        if dist < TILE_SIZE * 6 and dist < target_dist:
-            target_enemy = enemy
-            target_dist = dist
+    target_enemy = _nearest_enemy_near_building(view, candidate, TILE_SIZE * 6)
 
     if target_enemy:
-        dist_to_hero = hero.distance_to(target_enemy.x, target_enemy.y)
-        if dist_to_hero <= hero.attack_range:
-            engage(hero, target_enemy, now_ms, set_fighting=True, set_position=False)
-            return True
-        engage(hero, target_enemy, now_ms)
-        hero.state = HeroState.MOVING
+        engage_or_chase(hero, target_enemy, now_ms)
         return True
 
     # If we can't find an enemy, move to the building to "investigate/defend".
@@ -390,9 +436,8 @@ def start_retreat(ai: Any, hero: Any, view: Any) -> None:
     """Start retreating to safety."""
     view = as_ai_view(view)
     hero.state = HeroState.RETREATING
-    buildings = view.buildings
 
-    for building in buildings:
-        if building.building_type in ["castle", "marketplace"]:
-            hero.target_position = (building.center_x, building.center_y)
-            break
+    # First safe building in view order (per-tick snapshot shared with handle_retreating).
+    safe, _xs, _ys = tick_index.safe_buildings(view)
+    if safe:
+        hero.target_position = (safe[0].center_x, safe[0].center_y)
@@ -19,6 +19,7 @@ from game.sim.hero_guardrails_tunables import TARGET_COMMIT_WINDOW_S
 from game.sim.timebase import now_ms as sim_now_ms
 from game.world import Visibility
 
+from ai.behaviors import bounty_pursuit, daily_life, poi_awareness, tick_index
 from ai.behaviors.movement import route_to_building
 from ai.behaviors.shopping import blacksmith_has_affordable_upgrade, shop_cooldown_active
 from ai.behaviors.view_compat import as_ai_view
@@ -30,6 +31,9 @@ from ai.behaviors.view_compat import as_ai_view
 # symbol, so there is no import cycle.
 from ai.behaviors.zones import assign_patrol_zone
 
+# Idle heroes farther than this from their patrol zone walk back to it (squared).
+_ZONE_LEASH_SQ = (TILE_SIZE * 4) ** 2
+
 
 def _is_live_enemy_target(target: Any) -> bool:
     """True only for living enemy entities (not buildings/lairs with ``is_alive``)."""
@@ -61,44 +65,48 @@ def _find_black_fog_frontier_tiles(
     if scan_radius is None:
         scan_radius = RANGER_FRONTIER_SCAN_RADIUS_TILES
 
-    candidates = []
-    # Scan a square region around hero (bounded for perf).
-    for dy in range(-scan_radius, scan_radius + 1):
-        for dx in range(-scan_radius, scan_radius + 1):
-            gx = hero_gx + dx
-            gy = hero_gy + dy
-
-            # Bounds check.
-            if gx < 0 or gx >= world.width or gy < 0 or gy >= world.height:
-                continue
+    width = world.width
+    height = world.height
+    visibility = world.visibility
+    unseen = Visibility.UNSEEN
+    seen_states = (Visibility.SEEN, Visibility.VISIBLE)
+    min_d = None if min_dist_tiles is None else float(min_dist_tiles)
+    max_d = None if max_dist_tiles is None else float(max_dist_tiles)
 
+    candidates = []
+    # Scan a square region around hero (bounded for perf), clipped to the map so
+    # the inner loops need no bounds checks; rows are bound once per y.
+    gx_lo = max(0, hero_gx - scan_radius)
+    gx_hi = min(width - 1, hero_gx + scan_radius)
+    for gy in range(max(0, hero_gy - scan_radius), min(height - 1, hero_gy + scan_radius) + 1):
+        row = visibility[gy]
+        # Neighbour rows for the frontier probe (rows past the map edge are skipped).
+        adj_rows = [visibility[ay] for ay in (gy - 1, gy, gy + 1) if 0 <= ay < height]
+        dy = gy - hero_gy
+        for gx in range(gx_lo, gx_hi + 1):
             # Check if this tile is UNSEEN (black fog).
-            if world.visibility[gy][gx] != Visibility.UNSEEN:
+            if row[gx] != unseen:
                 continue
 
-            # Check if it's adjacent to SEEN or VISIBLE (frontier).
+            # Check if it's adjacent to SEEN or VISIBLE (frontier). The tile
+            # itself is UNSEEN, so probing the full 3x3 block is equivalent.
+            ax_lo = gx - 1 if gx > 0 else 0
+            ax_hi = gx + 2 if gx + 1 < width else width
             is_frontier = False
-            for adj_dy in [-1, 0, 1]:
-                for adj_dx in [-1, 0, 1]:
-                    if adj_dx == 0 and adj_dy == 0:
-                        continue
-                    adj_gx = gx + adj_dx
-                    adj_gy = gy + adj_dy
-                    if 0 <= adj_gx < world.width and 0 <= adj_gy < world.height:
-                        adj_vis = world.visibility[adj_gy][adj_gx]
-                        if adj_vis == Visibility.SEEN or adj_vis == Visibility.VISIBLE:
-                            is_frontier = True
-                            break
+            for adj_row in adj_rows:
+                for adj_vis in adj_row[ax_lo:ax_hi]:
+                    if adj_vis in seen_states:
+                        is_frontier = True
+                        break
                 if is_frontier:
                     break
 
             if is_frontier:
-                # Calculate distance (squared for comparison, avoid sqrt until needed).
-                dist_sq = dx * dx + dy * dy
-                dist_tiles = math.sqrt(dist_sq)
-                if min_dist_tiles is not None and dist_tiles < float(min_dist_tiles):
+                dx = gx - hero_gx
+                dist_tiles = math.sqrt(dx * dx + dy * dy)
+                if min_d is not None and dist_tiles < min_d:
                     continue
-                if max_dist_tiles is not None and dist_tiles > float(max_dist_tiles):
+                if max_d is not None and dist_tiles > max_d:
                     continue
                 candidates.append((gx, gy, dist_tiles))
 
@@ -333,12 +341,11 @@ def explore(ai: Any, hero: Any, view: Any) -> None:
 
 def _idle_clear_dangling_bounty(ai: Any, hero: Any, view: Any) -> bool:
     """Prelude: log IDLE + drop a stale ``bounty`` target. Always falls through."""
-    ai._debug_log(f"{hero.name} is IDLE at ({hero.x:.0f}, {hero.y:.0f})", throttle_key=f"{hero.name}_idle")
+    if getattr(ai, "debug_enabled", False):
+        ai._debug_log(f"{hero.name} is IDLE at ({hero.x:.0f}, {hero.y:.0f})", throttle_key=f"{hero.name}_idle")
 
     # If we were pursuing a bounty but ended up idle, clear it (avoid dangling targets).
     if hero.target and isinstance(hero.target, dict) and hero.target.get("type") == "bounty":
-        from ai.behaviors import bounty_pursuit
-
         if bounty_pursuit.bounty_commitment_active(hero, view):
             return bounty_pursuit.resume_committed_bounty(ai, hero, view)
         hero.target = None
@@ -370,7 +377,9 @@ def _idle_shopping(ai: Any, hero: Any, view: Any) -> bool:
         return False
     if hero.hp >= hero.max_hp:
         # V1.3 extension: check marketplace first, then blacksmith.
-        marketplace = ai.shopping_behavior.find_marketplace_with_potions(buildings)
+        marketplace = ai.shopping_behavior.find_marketplace_with_potions(
+            tick_index.buildings_of_type(view, "marketplace")
+        )
         if marketplace and hero.wants_to_shop(marketplace.can_sell_potions()):
             ai._debug_log(f"{hero.name} -> going shopping")
             route_to_building(hero, view.world, buildings, marketplace)
@@ -384,7 +393,7 @@ def _idle_shopping(ai: Any, hero: Any, view: Any) -> bool:
         # WK15: Base shopping on available items
         # WK127-T2: require a buyable upgrade — the naked `gold >= 50` check
         # sent maxed-out heroes on endless zero-purchase blacksmith trips.
-        blacksmith = ai.shopping_behavior.find_blacksmith(buildings, hero)
+        blacksmith = ai.shopping_behavior.find_blacksmith(tick_index.buildings_of_type(view, "blacksmith"), hero)
         if (
             blacksmith
             and hero.gold >= 50
@@ -400,22 +409,13 @@ def _idle_shopping(ai: Any, hero: Any, view: Any) -> bool:
 
 def _idle_engage_nearby_enemy(ai: Any, hero: Any, view: Any) -> bool:
     """Heroes only know about enemies within 5 tiles; if any, engage the closest."""
-    enemies = view.enemies
-
     # Heroes only know about enemies within 5 tiles of themselves (no map-wide awareness).
+    # Answered from the per-tick enemy grid (view order, exact distances).
     awareness_radius = TILE_SIZE * 5
-
-    enemies_nearby = []
-    for enemy in enemies:
-        if not enemy.is_alive:
-            continue
-
-        dist_to_hero = hero.distance_to(enemy.x, enemy.y)
-        if dist_to_hero <= awareness_radius:
-            enemies_nearby.append((enemy, dist_to_hero))
+    target_enemy, target_dist = tick_index.nearest_enemy_within(view, hero.x, hero.y, awareness_radius)
 
     # If there are enemies nearby, engage the closest one.
-    if enemies_nearby:
+    if target_enemy is not None:
         # WK2 anti-oscillation: respect commitment window unless current target is invalid.
         now_ms = int(sim_now_ms())
         if now_ms < int(getattr(hero, "_target_commit_until_ms", 0) or 0):
@@ -423,8 +423,6 @@ def _idle_engage_nearby_enemy(ai: Any, hero: Any, view: Any) -> bool:
             # WK61-R4-BUG-005: buildings now expose is_alive; only honor enemy commit windows.
             if _is_live_enemy_target(cur):
                 return True
-        enemies_nearby.sort(key=lambda x: x[1])
-        target_enemy, target_dist = enemies_nearby[0]
         ai._debug_log(f"{hero.name} -> sees enemy {target_dist:.0f}px away, engaging!")
         hero.target = target_enemy
         hero._target_commit_until_ms = int(now_ms + int(float(TARGET_COMMIT_WINDOW_S) * 1000.0))
@@ -438,23 +436,18 @@ def _idle_get_drink(ai: Any, hero: Any, view: Any) -> bool:
     """WK11: Get a drink at Inn (IDLE, full health, 10+ gold, ~10–15% chance per idle cycle)."""
     buildings = view.buildings
 
+    # Cheap per-hero gates first; the chance roll below is reached only when
+    # they pass, exactly as before (the gates read state, never the RNG).
+    if hero.hp < hero.max_hp or hero.gold < 10:
+        return False
+
     # No enemies are nearby here — the engage step already short-circuited if any
-    # were (so ``enemies_nearby`` is empty); recompute the same pure scan to keep
-    # the original ``not enemies_nearby`` predicate byte-identical.
-    awareness_radius = TILE_SIZE * 5
-    enemies_nearby = []
-    for enemy in view.enemies:
-        if not enemy.is_alive:
-            continue
-        dist_to_hero = hero.distance_to(enemy.x, enemy.y)
-        if dist_to_hero <= awareness_radius:
-            enemies_nearby.append((enemy, dist_to_hero))
-
-    if hero.hp >= hero.max_hp and hero.gold >= 10 and not enemies_nearby:
-        inns = [
-            b for b in buildings
-            if getattr(b, "building_type", None) == BuildingType.INN and getattr(b, "is_constructed", True)
-        ]
+    # were; re-check the same 5-tile predicate (cheap grid query) to keep the
+    # original ``not enemies_nearby`` guard byte-identical.
+    enemies_nearby = tick_index.any_enemy_within(view, hero.x, hero.y, TILE_SIZE * 5)
+
+    if not enemies_nearby:
+        inns = [b for b in tick_index.buildings_of_type(view, BuildingType.INN) if getattr(b, "is_constructed", True)]
         if inns and ai._ai_rng.random() < 0.12:  # ~12% chance
             inn = min(inns, key=lambda b: hero.distance_to(b.center_x, b.center_y))
             route_to_building(hero, view.world, buildings, inn)
@@ -466,9 +459,8 @@ def _idle_get_drink(ai: Any, hero: Any, view: Any) -> bool:
 
 def _idle_visit_poi(ai: Any, hero: Any, view: Any) -> bool:
     """WK55: Personality-driven POI visit (chance-gated to avoid constant POI chasing)."""
-    from ai.behaviors.poi_awareness import maybe_visit_poi
     if ai._ai_rng.random() < 0.08:  # ~8% per idle tick
-        if maybe_visit_poi(ai, hero, view):
+        if poi_awareness.maybe_visit_poi(ai, hero, view):
             ai._debug_log(f"{hero.name} -> visiting personality-matched POI")
             return True
     return False
@@ -476,8 +468,6 @@ def _idle_visit_poi(ai: Any, hero: Any, view: Any) -> bool:
 
 def _idle_daily_life(ai: Any, hero: Any, view: Any) -> bool:
     """WK140: ambient daily-life motives after POI visits, before terminal patrol."""
-    from ai.behaviors import daily_life
-
     return daily_life.try_daily_life(ai, hero, view)
 
 
@@ -492,21 +482,25 @@ def _idle_patrol_zone(ai: Any, hero: Any, view: Any) -> bool:
     # Get this hero's patrol zone.
     zone_x, zone_y = assign_patrol_zone(ai, hero, view)
 
-    ai._debug_log(
-        f"{hero.name} zone=({zone_x:.0f}, {zone_y:.0f}), hero at ({hero.x:.0f}, {hero.y:.0f})",
-        throttle_key=f"{hero.name}_zone",
-    )
-
-    ai._debug_log(
-        f"{hero.name} -> no enemies within {awareness_radius}px",
-        throttle_key=f"{hero.name}_no_enemy",
-    )
+    debug = getattr(ai, "debug_enabled", False)
+    if debug:
+        ai._debug_log(
+            f"{hero.name} zone=({zone_x:.0f}, {zone_y:.0f}), hero at ({hero.x:.0f}, {hero.y:.0f})",
+            throttle_key=f"{hero.name}_zone",
+        )
+        ai._debug_log(
+            f"{hero.name} -> no enemies within {awareness_radius}px",
+            throttle_key=f"{hero.name}_no_enemy",
+        )
 
     # No enemies in zone - patrol within our zone.
-    dist_to_zone = hero.distance_to(zone_x, zone_y)
-    ai._debug_log(f"{hero.name} dist_to_zone={dist_to_zone:.0f}")
+    zdx = hero.x - zone_x
+    zdy = hero.y - zone_y
+    zone_d2 = zdx * zdx + zdy * zdy
+    if debug:
+        ai._debug_log(f"{hero.name} dist_to_zone={math.sqrt(zone_d2):.0f}")
 
-    if dist_to_zone > TILE_SIZE * 4:
+    if zone_d2 > _ZONE_LEASH_SQ:
         # Too far from zone, return to it.
         ai._debug_log(f"{hero.name} -> returning to zone")
         hero.target_position = (zone_x, zone_y)
@@ -7,6 +7,7 @@ from typing import Any
 from config import FOOD_MEAL_COST_GOLD
 from game.entities.hero import HeroState
 
+from ai.behaviors import tick_index
 from ai.behaviors.movement import route_to_building
 from ai.behaviors.view_compat import as_ai_view
 from ai.contracts import HeroTask, TargetType, assign_hero_task
@@ -22,6 +23,12 @@ _INTERRUPTIBLE_TARGET_TYPES = frozenset({
 
 _CRITICAL_HP_FRACTION = 0.15
 
+# HeroState members bound once (see task_router): tick_meal_hunger runs for every
+# hero every tick, and each ``HeroState.X`` read goes through the Enum metaclass.
+_IDLE = HeroState.IDLE
+_MOVING = HeroState.MOVING
+_SHOPPING = HeroState.SHOPPING
+
 
 def _building_sort_key(building: Any) -> tuple:
     """Stable tie-break when two food stands are equidistant."""
@@ -47,8 +54,7 @@ def find_nearest_food_stand(hero: Any, buildings: list[Any]) -> Any | None:
 
     if not candidates:
         return None
-    candidates.sort(key=lambda row: (row[0], row[1]))
-    return candidates[0][2]
+    return min(candidates, key=lambda row: (row[0], row[1]))[2]
 
 
 def _log_no_food_stand_once(ai: Any, hero: Any) -> None:
@@ -133,7 +139,7 @@ def maybe_seek_meal_idle(ai: Any, hero: Any, view: Any) -> bool:
     if not should_seek_meal(hero):
         return False
 
-    food_stand = find_nearest_food_stand(hero, view.buildings)
+    food_stand = find_nearest_food_stand(hero, tick_index.buildings_of_type(view, "food_stand"))
     if food_stand is None:
         _log_no_food_stand_once(ai, hero)
         return False
@@ -153,7 +159,7 @@ def maybe_seek_meal_idle(ai: Any, hero: Any, view: Any) -> bool:
 def maybe_redirect_for_meal(ai: Any, hero: Any, view: Any) -> bool:
     """Interrupt discretionary movement when hunger becomes urgent."""
     view = as_ai_view(view)
-    if hero.state != HeroState.MOVING:
+    if hero.state != _MOVING:
         return False
     if not should_seek_meal(hero):
         return False
@@ -166,7 +172,7 @@ def maybe_redirect_for_meal(ai: Any, hero: Any, view: Any) -> bool:
         if target_type not in _INTERRUPTIBLE_TARGET_TYPES:
             return False
 
-    food_stand = find_nearest_food_stand(hero, view.buildings)
+    food_stand = find_nearest_food_stand(hero, tick_index.buildings_of_type(view, "food_stand"))
     if food_stand is None:
         _log_no_food_stand_once(ai, hero)
         return False
@@ -178,7 +184,7 @@ def maybe_redirect_for_meal(ai: Any, hero: Any, view: Any) -> bool:
 def maybe_interrupt_shopping_for_meal(ai: Any, hero: Any, view: Any) -> bool:
     """Leave marketplace shopping when hunger is urgent and hero can afford a meal."""
     view = as_ai_view(view)
-    if hero.state != HeroState.SHOPPING:
+    if hero.state != _SHOPPING:
         return False
     if not should_seek_meal(hero):
         return False
@@ -188,7 +194,7 @@ def maybe_interrupt_shopping_for_meal(ai: Any, hero: Any, view: Any) -> bool:
         setattr(hero, "pending_task", None)
         setattr(hero, "pending_task_building", None)
 
-    food_stand = find_nearest_food_stand(hero, view.buildings)
+    food_stand = find_nearest_food_stand(hero, tick_index.buildings_of_type(view, "food_stand"))
     if food_stand is None:
         _log_no_food_stand_once(ai, hero)
         return False
@@ -204,11 +210,11 @@ def tick_meal_hunger(ai: Any, hero: Any, view: Any) -> bool:
         return False
 
     st = hero.state
-    if st == HeroState.IDLE:
+    if st == _IDLE:
         return maybe_seek_meal_idle(ai, hero, view)
-    if st == HeroState.MOVING:
+    if st == _MOVING:
         return maybe_redirect_for_meal(ai, hero, view)
-    if st == HeroState.SHOPPING:
+    if st == _SHOPPING:
         return maybe_interrupt_shopping_for_meal(ai, hero, view)
     return False
 
@@ -234,7 +240,7 @@ def handle_meal_arrival(ai: Any, hero: Any, view: Any) -> bool:
 
     food_stand = target.get("food_stand")
     if food_stand is None:
-        food_stand = find_nearest_food_stand(hero, view.buildings)
+        food_stand = find_nearest_food_stand(hero, tick_index.buildings_of_type(view, "food_stand"))
 
     if food_stand is not None and try_buy_meal(ai, hero, food_stand):
         hero.target = None
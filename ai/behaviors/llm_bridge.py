@@ -5,8 +5,8 @@ from __future__ import annotations
 from typing import Any
 
 from config import LLM_DECISION_COOLDOWN, QUEST_DECLINE_COOLDOWN_MS, TILE_SIZE
-from ai.behaviors import hunger
-from ai.behaviors.view_compat import as_ai_view, view_to_legacy_context
+from ai.behaviors import bounty_pursuit, hunger, quest_offer, tick_index
+from ai.behaviors.view_compat import as_ai_view
 from ai.context_builder import ContextBuilder
 from ai.decision_moments import (
     consult_suppressed_by_request_state,
@@ -24,7 +24,6 @@ def _resolve_move_target(target: str, view: Any, hero: Any) -> tuple[float, floa
         return None
     view = as_ai_view(view)
     t = target.strip().lower()
-    buildings = view.buildings or []
     # Map common names to building_type.
     type_map = {
         "castle": "castle",
@@ -44,7 +43,7 @@ def _resolve_move_target(target: str, view: Any, hero: Any) -> tuple[float, floa
     btype = type_map.get(t)
     if not btype:
         return None
-    candidates = [b for b in buildings if getattr(b, "building_type", None) == btype]
+    candidates = tick_index.buildings_of_type(view, btype)
     if not candidates:
         return None
     # Nearest to hero.
@@ -69,11 +68,6 @@ def _commit_accept_bounty(ai: Any, hero: Any, view: Any, target: str) -> bool:
 
     Returns True iff the hero committed to a bounty.
     """
-    # Lazy import (mirrors the quest_offer import below): bounty_pursuit is a
-    # behaviors sibling; keeping it out of top-level imports avoids any
-    # load-order surprise for the direct-prompt chat path.
-    from ai.behaviors import bounty_pursuit
-
     view = as_ai_view(view)
     bounties = list(view.bounties or [])
     if not bounties:
@@ -198,11 +192,200 @@ def _decline_quest_chain(ai: Any, hero: Any, focus: dict, *, source: str, reason
     )
 
 
-def should_consult_llm(ai: Any, hero: Any, view: Any) -> bool:
-    """Determine if we should ask the LLM for a decision (WK50: named decision moments)."""
+# ---------------------------------------------------------------------------
+# LLM action handlers. Every handler takes the same
+# ``(ai, hero, target, view, reason, inputs_summary, source)`` arguments so
+# ``apply_llm_decision`` dispatches through one table lookup instead of an
+# if/elif ladder over action strings.
+# ---------------------------------------------------------------------------
+
+
+def _apply_retreat(
+    ai: Any, hero: Any, target: str, view: Any, reason: str, inputs_summary: dict, source: str
+) -> None:
+    ai.set_intent(hero, "returning_to_safety")
+    ai.record_decision(
+        hero,
+        action="retreat",
+        reason=reason or "Retreating",
+        intent="returning_to_safety",
+        inputs_summary=inputs_summary,
+        source=source,
+    )
+    ai.defense_behavior.start_retreat(ai, hero, view)
+
+
+def _apply_fight(
+    ai: Any, hero: Any, target: str, view: Any, reason: str, inputs_summary: dict, source: str
+) -> None:
+    ai.set_intent(hero, "engaging_enemy")
+    ai.record_decision(
+        hero,
+        action="fight",
+        reason=reason or "Fighting",
+        intent="engaging_enemy",
+        inputs_summary=inputs_summary,
+        source=source,
+    )
+    hero.state = HeroState.FIGHTING
+
+
+def _apply_buy_item(
+    ai: Any, hero: Any, target: str, view: Any, reason: str, inputs_summary: dict, source: str
+) -> None:
+    ai.set_intent(hero, "shopping")
+    ai.record_decision(
+        hero,
+        action="buy_item",
+        reason=reason or f"Buying {target}",
+        intent="shopping",
+        inputs_summary=inputs_summary,
+        source=source,
+    )
+    ai.shopping_behavior.go_shopping(ai, hero, target, view)
+
+
+def _apply_use_potion(
+    ai: Any, hero: Any, target: str, view: Any, reason: str, inputs_summary: dict, source: str
+) -> None:
+    ai.record_decision(
+        hero,
+        action="use_potion",
+        reason=reason or "Using potion",
+        intent=getattr(hero, "intent", "idle") or "idle",
+        inputs_summary=inputs_summary,
+        source=source,
+    )
+    hero.use_potion()
+
+
+def _apply_explore(
+    ai: Any, hero: Any, target: str, view: Any, reason: str, inputs_summary: dict, source: str
+) -> None:
+    ai.set_intent(hero, "idle")
+    ai.record_decision(
+        hero,
+        action="explore",
+        reason=reason or "Exploring",
+        intent="idle",
+        inputs_summary=inputs_summary,
+        source=source,
+    )
+    ai.exploration_behavior.explore(ai, hero, view)
+
+
+def _apply_accept_bounty(
+    ai: Any, hero: Any, target: str, view: Any, reason: str, inputs_summary: dict, source: str
+) -> None:
+    # WK134: previously a dead no-op while IDLE_SEEKING_ACTIVITY offered
+    # accept_bounty to the LLM. Now routes through the bounty-pursuit
+    # commit path; with no resolvable bounty it degrades to explore (same
+    # shape as the unresolvable move_to fallback below).
+    if _commit_accept_bounty(ai, hero, view, target or ""):
+        ai.set_intent(hero, "pursuing_bounty")
+        ai.record_decision(
+            hero,
+            action="accept_bounty",
+            reason=reason or "Accepting a bounty",
+            intent="pursuing_bounty",
+            inputs_summary=inputs_summary,
+            source=source,
+        )
+        return
+    ai._debug_log(
+        f"{hero.name} accept_bounty: no valid bounty available; exploring instead",
+        throttle_key=f"{hero.name}_accept_bounty_fallback",
+    )
+    ai.set_intent(hero, "idle")
+    ai.record_decision(
+        hero,
+        action="accept_bounty",
+        reason=reason or "No valid bounty available; exploring",
+        intent="idle",
+        inputs_summary=inputs_summary,
+        source=source,
+    )
+    ai.exploration_behavior.explore(ai, hero, view)
+
+
+def _apply_leave_building(
+    ai: Any, hero: Any, target: str, view: Any, reason: str, inputs_summary: dict, source: str
+) -> None:
+    if getattr(hero, "is_inside_building", False):
+        hero.pop_out_of_building()
+        setattr(hero, "pending_task", None)
+        setattr(hero, "pending_task_building", None)
+    ai.set_intent(hero, "idle")
+    ai.record_decision(
+        hero,
+        action="leave_building",
+        reason=reason or "Leaving building",
+        intent="idle",
+        inputs_summary=inputs_summary,
+        source=source,
+    )
+    hero.state = HeroState.IDLE
+
+
+def _apply_move_to(
+    ai: Any, hero: Any, target: str, view: Any, reason: str, inputs_summary: dict, source: str
+) -> None:
+    # WK18: Resolve target to (x,y) and set llm_move_request; engine drains into physical state.
+    dest = _resolve_move_target(target or "", view, hero)
+    if dest is not None:
+        hero.llm_move_request = dest
+        ai.set_intent(hero, "moving_to_destination")
+        ai.record_decision(
+            hero,
+            action="move_to",
+            reason=reason or f"Moving to {target or 'destination'}",
+            intent="moving_to_destination",
+            inputs_summary=inputs_summary,
+            source=source,
+        )
+        return
+    ai.set_intent(hero, "idle")
+    ai.record_decision(
+        hero,
+        action="move_to",
+        reason=reason or f"Moving to {target or 'destination'}",
+        intent="idle",
+        inputs_summary=inputs_summary,
+        source=source,
+    )
+    ai.exploration_behavior.explore(ai, hero, view)
+
+
+_ACTION_TABLE = {
+    "retreat": _apply_retreat,
+    "fight": _apply_fight,
+    "buy_item": _apply_buy_item,
+    "use_potion": _apply_use_potion,
+    "explore": _apply_explore,
+    "accept_bounty": _apply_accept_bounty,
+}
+
+# WK18 tool actions, matched on either ``tool_action`` or ``action`` (in order).
+_TOOL_ACTION_TABLE = (
+    ("leave_building", _apply_leave_building),
+    ("move_to", _apply_move_to),
+)
+
+
+def should_consult_llm(ai: Any, hero: Any, view: Any, now_ms: int | None = None) -> bool:
+    """Determine if we should ask the LLM for a decision (WK50: named decision moments).
+
+    ``now_ms`` lets the task router pass the sim time it already read for this
+    hero; omitted, the clock is read here.
+    """
     view = as_ai_view(view)
-    current_time = sim_now_ms()
-    moment = determine_decision_moment(hero, view_to_legacy_context(view), now_ms=current_time)
+    current_time = sim_now_ms() if now_ms is None else now_ms
+    # Moment-independent gates first: a pending request, or the base cooldown
+    # (no moment's cooldown is shorter), rules out a consult whichever moment
+    # applies, so most heroes skip the moment scan (and its HP/enemy reads).
+    if consult_suppressed_by_request_state(hero, current_time, LLM_DECISION_COOLDOWN) is not None:
+        return False
+    moment = determine_decision_moment(hero, tick_index.legacy_context(view), now_ms=current_time)
     if moment is None:
         return False
     cooldown_ms = max(LLM_DECISION_COOLDOWN, moment.cooldown_ms)
@@ -211,17 +394,19 @@ def should_consult_llm(ai: Any, hero: Any, view: Any) -> bool:
     return True
 
 
-def request_llm_decision(ai: Any, hero: Any, view: Any) -> None:
-    """Request a decision from the LLM brain."""
+def request_llm_decision(ai: Any, hero: Any, view: Any, now_ms: int | None = None) -> None:
+    """Request a decision from the LLM brain (``now_ms`` as in ``should_consult_llm``)."""
     if ai.llm_brain:
         view = as_ai_view(view)
-        now = sim_now_ms()
-        legacy = view_to_legacy_context(view)
+        now = sim_now_ms() if now_ms is None else now_ms
+        legacy = tick_index.legacy_context(view)
         moment = determine_decision_moment(hero, legacy, now_ms=now)
         if moment is None:
             return
         base_context = ContextBuilder.build_hero_context(hero, legacy)
-        autonomous = build_llm_context_for_moment(hero, legacy, moment, now_ms=now)
+        autonomous = build_llm_context_for_moment(
+            hero, legacy, moment, now_ms=now, hero_context=base_context
+        )
         context = {**base_context, "wk50_autonomous": autonomous}
         # WK134: discard any stale undelivered response (e.g. from a request the
         # pending-decision watchdog abandoned) so a late answer to an OLD moment
@@ -265,7 +450,7 @@ def apply_llm_decision(
     hero.last_llm_action = decision
 
     if context is None:
-        context = ContextBuilder.build_hero_context(hero, view_to_legacy_context(view))
+        context = ContextBuilder.build_hero_context(hero, tick_index.legacy_context(view))
     inputs_summary = ContextBuilder.build_inputs_summary(context)
     reason = decision.get("reasoning", "")
     if not isinstance(reason, str):
@@ -277,13 +462,8 @@ def apply_llm_decision(
     # WK126-T6: a staged quest offer (hero standing at a quest-giver) consumes
     # this decision as the accept/decline verdict — the REAL wiring the
     # accept_bounty no-op below never got. Inert unless hero._pending_quest_offer
-    # is set (impossible in the WK67 digest scenario — no givers exist). Lazy
-    # import: quest_offer imports decision_moments, which this module also
-    # imports; keeping it out of the top-level imports avoids any load-order
-    # surprise for the direct-prompt chat path.
-    from ai.behaviors import quest_offer as _quest_offer
-
-    if _quest_offer.maybe_apply_quest_offer_decision(ai, hero, decision, view, source=source):
+    # is set (impossible in the WK67 digest scenario — no givers exist).
+    if quest_offer.maybe_apply_quest_offer_decision(ai, hero, decision, view, source=source):
         return
 
     if action in {"accept_chain", "continue_phase", "decline_chain", "retreat_to_heal", "prepare_supplies"}:
@@ -409,131 +589,15 @@ def apply_llm_decision(
                 )
             return
 
-    if action == "retreat":
-        ai.set_intent(hero, "returning_to_safety")
-        ai.record_decision(
-            hero,
-            action="retreat",
-            reason=reason or "Retreating",
-            intent="returning_to_safety",
-            inputs_summary=inputs_summary,
-            source=source,
-        )
-        ai.defense_behavior.start_retreat(ai, hero, view)
-    elif action == "fight":
-        ai.set_intent(hero, "engaging_enemy")
-        ai.record_decision(
-            hero,
-            action="fight",
-            reason=reason or "Fighting",
-            intent="engaging_enemy",
-            inputs_summary=inputs_summary,
-            source=source,
-        )
-        hero.state = HeroState.FIGHTING
-    elif action == "buy_item":
-        ai.set_intent(hero, "shopping")
-        ai.record_decision(
-            hero,
-            action="buy_item",
-            reason=reason or f"Buying {target}",
-            intent="shopping",
-            inputs_summary=inputs_summary,
-            source=source,
-        )
-        ai.shopping_behavior.go_shopping(ai, hero, target, view)
-    elif action == "use_potion":
-        ai.record_decision(
-            hero,
-            action="use_potion",
-            reason=reason or "Using potion",
-            intent=getattr(hero, "intent", "idle") or "idle",
-            inputs_summary=inputs_summary,
-            source=source,
-        )
-        hero.use_potion()
-    elif action == "explore":
-        ai.set_intent(hero, "idle")
-        ai.record_decision(
-            hero,
-            action="explore",
-            reason=reason or "Exploring",
-            intent="idle",
-            inputs_summary=inputs_summary,
-            source=source,
-        )
-        ai.exploration_behavior.explore(ai, hero, view)
-    elif action == "accept_bounty":
-        # WK134: previously a dead no-op while IDLE_SEEKING_ACTIVITY offered
-        # accept_bounty to the LLM. Now routes through the bounty-pursuit
-        # commit path; with no resolvable bounty it degrades to explore (same
-        # shape as the unresolvable move_to fallback below).
-        if _commit_accept_bounty(ai, hero, view, target or ""):
-            ai.set_intent(hero, "pursuing_bounty")
-            ai.record_decision(
-                hero,
-                action="accept_bounty",
-                reason=reason or "Accepting a bounty",
-                intent="pursuing_bounty",
-                inputs_summary=inputs_summary,
-                source=source,
-            )
-        else:
-            ai._debug_log(
-                f"{hero.name} accept_bounty: no valid bounty available; exploring instead",
-                throttle_key=f"{hero.name}_accept_bounty_fallback",
-            )
-            ai.set_intent(hero, "idle")
-            ai.record_decision(
-                hero,
-                action="accept_bounty",
-                reason=reason or "No valid bounty available; exploring",
-                intent="idle",
-                inputs_summary=inputs_summary,
-                source=source,
-            )
-            ai.exploration_behavior.explore(ai, hero, view)
-    elif tool_action == "leave_building" or action == "leave_building":
-        if getattr(hero, "is_inside_building", False):
-            hero.pop_out_of_building()
-            setattr(hero, "pending_task", None)
-            setattr(hero, "pending_task_building", None)
-        ai.set_intent(hero, "idle")
-        ai.record_decision(
-            hero,
-            action="leave_building",
-            reason=reason or "Leaving building",
-            intent="idle",
-            inputs_summary=inputs_summary,
-            source=source,
-        )
-        hero.state = HeroState.IDLE
-    elif tool_action == "move_to" or action == "move_to":
-        # WK18: Resolve target to (x,y) and set llm_move_request; engine drains into physical state.
-        dest = _resolve_move_target(target or "", view, hero)
-        if dest is not None:
-            hero.llm_move_request = dest
-            ai.set_intent(hero, "moving_to_destination")
-            ai.record_decision(
-                hero,
-                action="move_to",
-                reason=reason or f"Moving to {target or 'destination'}",
-                intent="moving_to_destination",
-                inputs_summary=inputs_summary,
-                source=source,
-            )
-        else:
-            ai.set_intent(hero, "idle")
-            ai.record_decision(
-                hero,
-                action="move_to",
-                reason=reason or f"Moving to {target or 'destination'}",
-                intent="idle",
-                inputs_summary=inputs_summary,
-                source=source,
-            )
-            ai.exploration_behavior.explore(ai, hero, view)
-    else:
+    handler = _ACTION_TABLE.get(action)
+    if handler is None:
+        # Tool actions also match on ``tool_action`` (WK18), but only once the
+        # plain actions above have missed — same precedence as the old ladder.
+        for name, tool_handler in _TOOL_ACTION_TABLE:
+            if tool_action == name or action == name:
+                handler = tool_handler
+                break
+    if handler is None:
         ai._debug_log(
             f"{hero.name} received unknown LLM action={action!r}; ignoring",
             throttle_key=f"{hero.name}_unknown_llm_action",
@@ -546,3 +610,5 @@ def apply_llm_decision(
             inputs_summary=inputs_summary,
             source=source,
         )
+        return
+    handler(ai, hero, target, view, reason, inputs_summary, source)
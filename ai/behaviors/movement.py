@@ -29,8 +29,34 @@ from game.entities.hero import HeroState
 from game.sim.timebase import now_ms as sim_now_ms
 from game.systems.navigation import best_adjacent_tile
 
+from ai.behaviors import tick_index
 from ai.behaviors.view_compat import as_ai_view
 
+# Squared radii for handle_moving's proximity checks (compared against squared
+# distances, so the per-frame arrival / chase-leash tests skip the sqrt).
+_ARRIVAL_RADIUS_SQ = (TILE_SIZE * 1.5) ** 2
+_MAX_CHASE_SQ = (TILE_SIZE * 8) ** 2
+
+# Activity target tags (``hero.target["type"]``) that handle_moving must not
+# auto-engage out of. One frozenset probe per moving hero per frame instead of a
+# linear walk over a list literal.
+_NON_COMBAT_TARGET_TYPES = frozenset(
+    {
+        "going_home",
+        "shopping",
+        "rest_inn",
+        "get_drink",
+        "patrol",
+        "guard_home",
+        "patrol_castle",
+        "defend_castle",
+        "direct_prompt",
+        "bounty",
+        "visit_poi",  # WK55: personality-driven POI visit
+        "buy_meal",  # WK61-R10: hunger meal at food stand
+    }
+)
+
 
 def route_to_building(hero: Any, world: Any, buildings: Any, building: Any) -> None:
     """Point ``hero.target_position`` at the best reachable tile beside ``building``.
@@ -64,9 +90,17 @@ def handle_moving(ai: Any, hero: Any, view: Any) -> None:
     buildings = view.buildings
     bounty_pursuit._seed_direct_prompt_explore_bearing(hero)
 
+    # Classify the target once: its task type when it is a task dict, else None
+    # (live entity / no target). Every branch below that reassigns hero.target
+    # returns, so the classification holds for the whole call.
+    target = hero.target
+    target_type = target.get("type") if target and isinstance(target, dict) else None
+
     # Bounty pursuit: claim/abandon logic while walking.
-    if hero.target and isinstance(hero.target, dict) and hero.target.get("type") == "bounty":
-        bounty = bounty_pursuit._resolve_bounty_from_target(hero.target, view.bounties)
+    if target_type == "bounty":
+        bounty = bounty_pursuit._resolve_bounty_from_target(
+            target, view.bounties, tick_index.bounty_by_id(view)
+        )
         if bounty is None:
             # Bounty vanished (claimed/cleaned up).
             hero.target = None
@@ -85,7 +119,7 @@ def handle_moving(ai: Any, hero: Any, view: Any) -> None:
 
         # Timeout to avoid permanent lock.
         now_ms = sim_now_ms()
-        started_ms = int(hero.target.get("started_ms", now_ms))
+        started_ms = int(target.get("started_ms", now_ms))
         if now_ms - started_ms > ai.bounty_max_pursue_ms:
             if hasattr(bounty, "unassign") and getattr(bounty, "assigned_to", None) == hero.name:
                 bounty.unassign()
@@ -98,7 +132,10 @@ def handle_moving(ai: Any, hero: Any, view: Any) -> None:
         goal_x, goal_y = (float(getattr(bounty, "x", hero.x)), float(getattr(bounty, "y", hero.y)))
         if hasattr(bounty, "get_goal_position"):
             goal_x, goal_y = bounty.get_goal_position(buildings)
-        if hero.distance_to(goal_x, goal_y) <= float(ai.bounty_claim_radius_px):
+        claim_radius = float(ai.bounty_claim_radius_px)
+        dx = hero.x - goal_x
+        dy = hero.y - goal_y
+        if dx * dx + dy * dy <= claim_radius * claim_radius:
             btype = str(getattr(bounty, "bounty_type", "explore") or "explore")
 
             # Typed bounties are not proximity-claimed.
@@ -139,10 +176,17 @@ def handle_moving(ai: Any, hero: Any, view: Any) -> None:
                 return
             # Other typed bounties: don't auto-claim here; let their systems resolve completion.
 
+    # Hot path for every MOVING hero each tick: read the position once into
+    # locals (each branch below returns after mutating the hero).
+    hero_x = hero.x
+    hero_y = hero.y
+
     # Check if reached destination.
-    if hero.target_position:
-        dist = hero.distance_to(hero.target_position[0], hero.target_position[1])
-        if dist <= TILE_SIZE * 1.5:
+    target_position = hero.target_position
+    if target_position:
+        dx = hero_x - target_position[0]
+        dy = hero_y - target_position[1]
+        if dx * dx + dy * dy <= _ARRIVAL_RADIUS_SQ:
             # WK64 (audit item 17): the reached-destination arrival dispatch was
             # extracted to ai/arrival_handlers.py (a TargetType-keyed registry).
             # dispatch_arrival consumes hero.target via coerce_task; it returns
@@ -158,36 +202,28 @@ def handle_moving(ai: Any, hero: Any, view: Any) -> None:
             hero.state = HeroState.IDLE
             return
 
+    if not target:
+        return
+
     # Only auto-engage if we're moving toward an enemy target (not patrolling/shopping/etc).
-    if hero.target and isinstance(hero.target, dict):
-        target_type = hero.target.get("type")
-        # Don't interrupt these activities.
-        if target_type in [
-            "going_home",
-            "shopping",
-            "rest_inn",
-            "get_drink",
-            "patrol",
-            "guard_home",
-            "patrol_castle",
-            "defend_castle",
-            "direct_prompt",
-            "bounty",
-            "visit_poi",  # WK55: personality-driven POI visit
-            "buy_meal",  # WK61-R10: hunger meal at food stand
-        ]:
-            return
+    if target_type in _NON_COMBAT_TARGET_TYPES:
+        return
+
+    is_entity = hasattr(target, "is_alive")
+    is_building = hasattr(target, "building_type")
+    is_lair = getattr(target, "is_lair", False)
 
     # If chasing an enemy, check if we've gone too far from our zone (8 tiles max).
     # WK61-FIX: exclude lair/building targets — only zone-limit enemy chases.
     # Buildings now have is_alive (WK61-BUG-003), so hasattr alone is too broad.
-    if hero.target and hasattr(hero.target, "is_alive") and not getattr(hero.target, "is_lair", False) and not hasattr(hero.target, "building_type"):
+    if is_entity and not is_lair and not is_building:
         zone_x, zone_y = ai.exploration_behavior.assign_patrol_zone(ai, hero, view)
-        dist_to_zone = math.sqrt((hero.x - zone_x) ** 2 + (hero.y - zone_y) ** 2)
-        max_chase_dist = TILE_SIZE * 8
+        zdx = hero_x - zone_x
+        zdy = hero_y - zone_y
+        zone_d2 = zdx * zdx + zdy * zdy
 
-        if dist_to_zone > max_chase_dist:
-            ai._debug_log(f"{hero.name} -> too far from zone ({dist_to_zone:.0f}px), giving up chase")
+        if zone_d2 > _MAX_CHASE_SQ:
+            ai._debug_log(f"{hero.name} -> too far from zone ({math.sqrt(zone_d2):.0f}px), giving up chase")
             hero.target = None
             hero.target_position = None
             hero.state = HeroState.IDLE
@@ -195,8 +231,9 @@ def handle_moving(ai: Any, hero: Any, view: Any) -> None:
 
     # If we have an enemy target, check if we're in range to fight.
     # WK61-FIX: also enter FIGHTING for lair targets (is_lair) so heroes attack lairs.
-    if hero.target and hasattr(hero.target, "is_alive") and hero.target.is_alive and (not hasattr(hero.target, "building_type") or getattr(hero.target, "is_lair", False)):
-        dist = hero.distance_to(hero.target.x, hero.target.y)
-        if dist <= hero.attack_range:
+    if is_entity and target.is_alive and (not is_building or is_lair):
+        dx = hero_x - target.x
+        dy = hero_y - target.y
+        attack_range = hero.attack_range
+        if dx * dx + dy * dy <= attack_range * attack_range:
             hero.state = HeroState.FIGHTING
-            return
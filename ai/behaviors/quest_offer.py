@@ -194,8 +194,7 @@ def maybe_approach_quest_giver(ai: Any, hero: Any, view: Any) -> bool:
         return False
 
     # Commit: nearest candidate (deterministic tie-break on giver_id).
-    candidates.sort(key=lambda c: (c[0], c[1]))
-    _, gid, giver = candidates[0]
+    _, gid, giver = min(candidates, key=lambda c: (c[0], c[1]))
     hero.set_target_position(float(giver.x), float(giver.y))
     hero.target = {"type": "quest_offer", "giver_id": gid, "started_ms": now}
     hero.state = HeroState.MOVING
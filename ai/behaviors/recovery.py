@@ -16,31 +16,27 @@ from config import TILE_SIZE
 from game.entities.hero import HeroState
 from game.sim.determinism import get_rng
 
+from ai.behaviors.tick_index import nearest_safe_building
+
 if TYPE_CHECKING:
     from ai.basic_ai import BasicAI
 
+# Squared "reached safety" radius (compared against squared distances).
+_SAFE_ARRIVAL_SQ = (TILE_SIZE * 2) ** 2
+
 
 def handle_retreating(ai: "BasicAI", hero, view) -> None:
     """Handle retreating state - flee to safety."""
-    buildings = view.buildings
-
     # V1.3 extension: use potion during retreat if available and health is low.
     if hero.health_percent < 0.7 and hero.potions > 0:
         hero.use_potion()
         ai._debug_log(f"{hero.name} -> using potion while retreating (health={hero.health_percent:.1%})")
 
-    nearest_safe = None
-    nearest_dist = float("inf")
-
-    for building in buildings:
-        if building.building_type in ["castle", "marketplace"]:
-            dist = hero.distance_to(building.center_x, building.center_y)
-            if dist < nearest_dist:
-                nearest_dist = dist
-                nearest_safe = building
+    # Safe buildings are snapshotted once per tick (see tick_index.safe_buildings).
+    nearest_safe, nearest_d2 = nearest_safe_building(view, hero.x, hero.y)
 
     if nearest_safe:
-        if nearest_dist < TILE_SIZE * 2:
+        if nearest_d2 < _SAFE_ARRIVAL_SQ:
             hero.state = HeroState.IDLE
         else:
             hero.target_position = (nearest_safe.center_x, nearest_safe.center_y)
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 from typing import Any
 
+from game.entities.buildings.economic import group_items_by_type
 from game.entities.hero import HeroState
 from game.sim.timebase import now_ms as sim_now_ms
 
+from ai.behaviors import tick_index
 from ai.behaviors.movement import route_to_building
-from ai.behaviors.view_compat import as_ai_view, view_to_legacy_context
+from ai.behaviors.view_compat import as_ai_view
 from ai.contracts import HeroTask, TargetType, assign_hero_task
 from game.sim.hero_commands import HeroPurchaseCommand
 
@@ -36,12 +38,13 @@ def blacksmith_has_affordable_upgrade(hero: Any, building: Any) -> bool:
         return False
     current_attack = hero.weapon.get("attack", 0) if hero.weapon else 0
     current_defense = hero.armor.get("defense", 0) if hero.armor else 0
-    for item in building.get_available_items():
-        if hero.gold < item.get("price", 0):
-            continue
-        if item.get("type") == "weapon" and item.get("attack", 0) > current_attack:
+    gold = hero.gold
+    by_type = _shop_items_by_type(building)
+    for item in by_type.get("weapon", ()):
+        if gold >= item.get("price", 0) and item.get("attack", 0) > current_attack:
             return True
-        if item.get("type") == "armor" and item.get("defense", 0) > current_defense:
+    for item in by_type.get("armor", ()):
+        if gold >= item.get("price", 0) and item.get("defense", 0) > current_defense:
             return True
     return False
 
@@ -78,16 +81,14 @@ def go_shopping(ai: Any, hero: Any, item_name: str, view: Any) -> None:
 
     target_building = None
     item_lower = (item_name or "").lower()
+    marketplaces = tick_index.buildings_of_type(view, "marketplace")
     if "potion" in item_lower:
-        target_building = find_marketplace_with_potions(buildings)
+        target_building = find_marketplace_with_potions(marketplaces)
     else:
-        target_building = find_blacksmith(buildings, hero)
-        
-    if not target_building:
-        for building in buildings:
-            if building.building_type == "marketplace":
-                target_building = building
-                break
+        target_building = find_blacksmith(tick_index.buildings_of_type(view, "blacksmith"), hero)
+
+    if not target_building and marketplaces:
+        target_building = marketplaces[0]
 
     if target_building:
         route_to_building(hero, world, buildings, target_building)
@@ -109,6 +110,18 @@ def go_shopping(ai: Any, hero: Any, item_name: str, view: Any) -> None:
         assign_hero_task(hero, task)
 
 
+def _shop_items_by_type(building: Any) -> dict[str, list[dict]]:
+    """The shop's catalogue grouped by item type (shop order kept per type).
+
+    Marketplace / Blacksmith keep the grouping cached between stock changes;
+    other sellers (tests, legacy shims) are grouped from ``get_available_items``.
+    """
+    get_items_by_type = getattr(building, "get_items_by_type", None)
+    if get_items_by_type is not None:
+        return get_items_by_type()
+    return group_items_by_type(building.get_available_items())
+
+
 def do_shopping(ai: Any, hero: Any, building: Any, view: Any) -> bool:
     """Actually perform shopping at a marketplace or blacksmith.
 
@@ -125,14 +138,13 @@ def do_shopping(ai: Any, hero: Any, building: Any, view: Any) -> bool:
     ``view`` is the :class:`~game.sim.ai_view.AiGameView` threaded from the
     Move-5 migration (it carries ``view.commands``). The post-shopping journey
     trigger still consumes the legacy/bridge context mapping, projected from the
-    view via :func:`~ai.behaviors.view_compat.view_to_legacy_context`.
+    view via :func:`~ai.behaviors.tick_index.legacy_context` (shared per tick).
     """
     view = as_ai_view(view)
     sink = view.commands
     # Support both marketplace and blacksmith (both have get_available_items).
     if not hasattr(building, "get_available_items"):
         return False
-    items = building.get_available_items()
     purchased_types: set[str] = set()
 
     # WK131: sell carried backpack loot FIRST (anything in the backpack is by
@@ -143,39 +155,41 @@ def do_shopping(ai: Any, hero: Any, building: Any, view: Any) -> bool:
     if getattr(hero, "backpack", None) and hasattr(hero, "sell_backpack_items"):
         hero.sell_backpack_items(building)
 
+    # Catalogue bucketed by item type (shop order kept within each type); each
+    # priority below walks only its own bucket instead of the full list.
+    by_type = _shop_items_by_type(building)
+    potions = by_type.get("potion", ())
+
     # Priority 1: Buy a potion if we have none.
     if hero.potions == 0 and hero.gold >= 20:
-        for item in items:
-            if item["type"] == "potion":
-                if sink.propose(HeroPurchaseCommand(hero.hero_id, item)):
-                    purchased_types.add("potion")
-                    break
+        for item in potions:
+            if sink.propose(HeroPurchaseCommand(hero.hero_id, item)):
+                purchased_types.add("potion")
+                break
 
     # Priority 2: Buy extra potions if rich.
     if hero.gold >= 50 and hero.potions < 2:
-        for item in items:
-            if item["type"] == "potion" and hero.gold >= item["price"]:
+        for item in potions:
+            if hero.gold >= item["price"]:
                 if sink.propose(HeroPurchaseCommand(hero.hero_id, item)):
                     purchased_types.add("potion")
                     break
 
     # Priority 3: Weapon upgrade.
-    for item in items:
-        if item["type"] == "weapon" and hero.gold >= item["price"]:
-            current_attack = hero.weapon.get("attack", 0) if hero.weapon else 0
-            if item["attack"] > current_attack:
-                if sink.propose(HeroPurchaseCommand(hero.hero_id, item)):
-                    purchased_types.add("weapon")
-                    break
+    current_attack = hero.weapon.get("attack", 0) if hero.weapon else 0
+    for item in by_type.get("weapon", ()):
+        if hero.gold >= item["price"] and item["attack"] > current_attack:
+            if sink.propose(HeroPurchaseCommand(hero.hero_id, item)):
+                purchased_types.add("weapon")
+                break
 
     # Priority 4: Armor upgrade.
-    for item in items:
-        if item["type"] == "armor" and hero.gold >= item["price"]:
-            current_defense = hero.armor.get("defense", 0) if hero.armor else 0
-            if item["defense"] > current_defense:
-                if sink.propose(HeroPurchaseCommand(hero.hero_id, item)):
-                    purchased_types.add("armor")
-                    break
+    current_defense = hero.armor.get("defense", 0) if hero.armor else 0
+    for item in by_type.get("armor", ()):
+        if hero.gold >= item["price"] and item["defense"] > current_defense:
+            if sink.propose(HeroPurchaseCommand(hero.hero_id, item)):
+                purchased_types.add("armor")
+                break
 
     # WK127-T2: a trip that bought nothing means the want/buy predicates are
     # unsatisfiable right now — stamp the sim-time cooldown so the idle/LLM
@@ -185,5 +199,5 @@ def do_shopping(ai: Any, hero: Any, building: Any, view: Any) -> bool:
 
     # Post-shopping journey trigger (full health + recent purchase).
     return ai.journey_behavior._maybe_start_journey(
-        ai, hero, view_to_legacy_context(view), purchased_types
+        ai, hero, tick_index.legacy_context(view), purchased_types
     )
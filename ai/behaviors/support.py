@@ -19,6 +19,7 @@ ONLY as a ``hero_class == "cleric"``-gated branch so no other class is affected.
 
 from __future__ import annotations
 
+import math
 from typing import Any
 
 from config import CLERIC_HEAL_MIN_TARGET_PCT
@@ -72,13 +73,16 @@ def cleric_seek_and_support(ai: Any, hero: Any, view: Any) -> bool:
 
     # Find the nearest ally that is wounded or in combat (pure scan, no mutation).
     nearest_ally = None
-    nearest_dist = float("inf")
+    nearest_d2 = math.inf
+    hx, hy = hero.x, hero.y
     for ally in view.heroes:
         if not _ally_needs_support(hero, ally):
             continue
-        dist = hero.distance_to(ally.x, ally.y)
-        if dist < nearest_dist:
-            nearest_dist = dist
+        dx = hx - ally.x
+        dy = hy - ally.y
+        d2 = dx * dx + dy * dy
+        if d2 < nearest_d2:
+            nearest_d2 = d2
             nearest_ally = ally
 
     # No ally needs support: pure read, NO state change, fall through to default.
@@ -90,5 +94,5 @@ def cleric_seek_and_support(ai: Any, hero: Any, view: Any) -> bool:
     hero.state = HeroState.MOVING
     hero.target = {"type": "support_ally"}
     hero._target_commit_until_ms = _commit_until_ms(now_ms)
-    ai._debug_log(f"{hero.name} -> supporting wounded/fighting ally at {nearest_dist:.0f}px")
+    ai._debug_log(f"{hero.name} -> supporting wounded/fighting ally at {math.sqrt(nearest_d2):.0f}px")
     return True
@@ -0,0 +1,304 @@
+"""Per-tick AI indices derived from the read-only :class:`AiGameView`.
+
+Mythos S5 (``defense.building_threatened``) established the pattern this module
+generalizes: ``SimEngine.build_ai_view`` builds a fresh view every tick, and
+enemy positions / liveness do not change during the AI pass (movement, combat
+and damage all run later in the tick). Anything derived purely from the view can
+therefore be computed ONCE per tick and shared by every hero, instead of each
+hero re-scanning ``view.enemies`` from scratch (O(heroes x enemies) Python work).
+
+The memo lives on the view itself, so its lifetime is exactly one tick. Views
+that cannot host it (the slots-based legacy-dict adapter used by the
+direct-prompt / observe_sync paths) fall back to building the index per call —
+same answers, just uncached. ``KINGDOM_AI_THREAT_MEMO=0`` disables every memo
+(A/B hatch, kept under its Mythos-era name).
+
+Every query returns results in ``view.enemies`` order, with distances equal to
+what ``Hero.distance_to`` returns. ``nearest_index`` squares with ``dx * dx``
+where ``distance_to`` uses ``** 2``. The two forms are equivalent because both
+round correctly for floats. Callers that tie-break on list order (stable sorts,
+first-wins scans) therefore make byte-identical choices — the WK67 AI-decision
+digest stays pinned.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from typing import Any
+
+from config import TILE_SIZE
+
+from ai.behaviors.view_compat import view_to_legacy_context
+
+_THREAT_MEMO_ENABLED = os.environ.get("KINGDOM_AI_THREAT_MEMO", "1") != "0"
+
+# Grid cell edge. Queries scan every cell overlapping the query circle's bounding
+# box, so any cell size is correct; 4 tiles keeps the common 5-6 tile awareness
+# queries at a 3x3 / 4x4 cell neighbourhood.
+ENEMY_GRID_CELL_PX = TILE_SIZE * 4
+
+# Where a retreating hero heads (``recovery.handle_retreating``/``defense.start_retreat``).
+SAFE_BUILDING_TYPES = ("castle", "marketplace")
+
+
+def view_tick_memo(view: Any) -> dict | None:
+    """Per-tick memo dict hosted on the AI view, or None when not memoizable."""
+    if not _THREAT_MEMO_ENABLED:
+        return None
+    memo = getattr(view, "_mythos_tick_memo", None)
+    if memo is None:
+        memo = {}
+        try:
+            # AiGameView is a frozen dataclass — bypass its setattr guard.
+            object.__setattr__(view, "_mythos_tick_memo", memo)
+        except (AttributeError, TypeError):
+            return None  # slots-based adapter (legacy dict path): no caching
+    return memo
+
+
+def enemy_soa(view: Any) -> tuple[tuple, tuple, tuple]:
+    """``(enemies, xs, ys)`` for the tick's living enemies, in view order.
+
+    Structure-of-arrays snapshot: the coordinates are read off the enemy objects
+    once per tick, so nearest-enemy scans iterate two flat float tuples instead
+    of doing two attribute lookups plus a ``distance_to`` call per enemy per hero.
+    """
+    memo = view_tick_memo(view)
+    if memo is not None:
+        soa = memo.get("enemy_soa")
+        if soa is not None:
+            return soa
+    alive = tuple(e for e in (view.enemies or ()) if getattr(e, "is_alive", False))
+    soa = (alive, tuple(e.x for e in alive), tuple(e.y for e in alive))
+    if memo is not None:
+        memo["enemy_soa"] = soa
+    return soa
+
+
+def alive_enemies(view: Any) -> tuple:
+    """The tick's living enemies, in view order (shared, filtered once per tick).
+
+    Hero loops iterate this instead of ``view.enemies`` and drop their own
+    per-enemy ``is_alive`` check.
+    """
+    return enemy_soa(view)[0]
+
+
+def nearest_index(xs: Any, ys: Any, x: float, y: float) -> tuple[int, float]:
+    """Pure-numeric nearest-point kernel: ``(index, squared_dist)`` or ``(-1, inf)``.
+
+    Operates on parallel coordinate sequences only (no entity objects), so every
+    nearest-X scan shares one tight loop. Ties keep the lowest index (strict
+    ``<``), matching the first-wins ``if dist < best_dist`` scans it replaces.
+    """
+    best = -1
+    best_d2 = math.inf
+    i = 0
+    for px, py in zip(xs, ys):
+        dx = px - x
+        dy = py - y
+        d2 = dx * dx + dy * dy
+        if d2 < best_d2:
+            best_d2 = d2
+            best = i
+        i += 1
+    return best, best_d2
+
+
+def buildings_of_type(view: Any, *types: Any) -> tuple:
+    """Buildings whose ``building_type`` is one of ``types``, in view order.
+
+    Memoized per tick and per type-set, so the many "find a marketplace / inn /
+    blacksmith" filters each hero runs share one pass over ``view.buildings``.
+    ``BuildingType`` is a ``str`` enum, so members and plain strings match alike.
+    """
+    memo = view_tick_memo(view)
+    key = ("buildings_of_type", types)
+    if memo is not None:
+        hit = memo.get(key)
+        if hit is not None:
+            return hit
+    wanted = frozenset(types)
+    hit = tuple(b for b in (view.buildings or ()) if getattr(b, "building_type", None) in wanted)
+    if memo is not None:
+        memo[key] = hit
+    return hit
+
+
+def safe_buildings(view: Any) -> tuple[tuple, tuple, tuple]:
+    """``(buildings, xs, ys)`` for the castle/marketplace buildings, in view order.
+
+    Buildings never move, and the view is rebuilt every tick, so this per-tick
+    snapshot is invalidated automatically when a building is placed or destroyed.
+    """
+    memo = view_tick_memo(view)
+    if memo is not None:
+        soa = memo.get("safe_buildings")
+        if soa is not None:
+            return soa
+    safe = buildings_of_type(view, *SAFE_BUILDING_TYPES)
+    soa = (safe, tuple(b.center_x for b in safe), tuple(b.center_y for b in safe))
+    if memo is not None:
+        memo["safe_buildings"] = soa
+    return soa
+
+
+def nearest_safe_building(view: Any, x: float, y: float) -> tuple[Any, float]:
+    """``(building, squared_dist)`` of the nearest safe building, or ``(None, inf)``."""
+    buildings, xs, ys = safe_buildings(view)
+    idx, d2 = nearest_index(xs, ys, x, y)
+    if idx < 0:
+        return None, math.inf
+    return buildings[idx], d2
+
+
+def nearest_enemy(view: Any, x: float, y: float) -> tuple[Any, float]:
+    """``(enemy, dist)`` of the living enemy nearest ``(x, y)``, or ``(None, inf)``."""
+    enemies, xs, ys = enemy_soa(view)
+    idx, d2 = nearest_index(xs, ys, x, y)
+    if idx < 0:
+        return None, math.inf
+    return enemies[idx], math.sqrt(d2)
+
+
+def bounty_by_id(view: Any) -> dict:
+    """``{bounty_id: bounty}`` for the tick's bounties (first in view order wins).
+
+    Every bounty-pursuing hero resolves its ``{"type": "bounty"}`` target each
+    tick; the shared map turns that per-hero list scan into one dict lookup.
+    Bounties without an id are left out (they resolve via ``bounty_ref``).
+    """
+    memo = view_tick_memo(view)
+    if memo is not None:
+        hit = memo.get("bounty_by_id")
+        if hit is not None:
+            return hit
+    by_id: dict = {}
+    for bounty in view.bounties or ():
+        bid = getattr(bounty, "bounty_id", None)
+        if bid is not None and bid not in by_id:
+            by_id[bid] = bounty
+    if memo is not None:
+        memo["bounty_by_id"] = by_id
+    return by_id
+
+
+def legacy_context(view: Any) -> dict:
+    """The tick's shared ``view_to_legacy_context`` projection (treat as read-only).
+
+    Every hero that consults / applies an LLM decision (and the journey trigger,
+    direct-prompt explore resolver) used to rebuild the same 17-key dict from the
+    same view. Its values are the view's own fields — constant for the tick — so
+    one projection is shared by all heroes. None of its consumers write to it.
+    """
+    memo = view_tick_memo(view)
+    if memo is None:
+        return view_to_legacy_context(view)
+    legacy = memo.get("legacy_context")
+    if legacy is None:
+        legacy = view_to_legacy_context(view)
+        memo["legacy_context"] = legacy
+    return legacy
+
+
+class EnemyGrid:
+    """Uniform spatial hash over one tick's living enemies.
+
+    ``cells`` maps ``(cell_x, cell_y)`` to ``[(order, enemy), ...]`` where
+    ``order`` is the enemy's index in ``view.enemies``; queries use it to hand
+    results back in view order.
+    """
+
+    __slots__ = ("cell", "cells")
+
+    def __init__(self, enemies: Any, cell: float = ENEMY_GRID_CELL_PX):
+        self.cell = cell
+        cells: dict[tuple[int, int], list] = {}
+        for order, enemy in enumerate(enemies):
+            if not getattr(enemy, "is_alive", False):
+                continue
+            key = (int(enemy.x // cell), int(enemy.y // cell))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [(order, enemy)]
+            else:
+                bucket.append((order, enemy))
+        self.cells = cells
+
+    def candidates(self, x: float, y: float, radius: float) -> list:
+        """``(order, enemy)`` pairs in every cell overlapping the radius box.
+
+        A superset of the enemies within ``radius`` (callers apply the exact
+        distance test), sorted into view order.
+        """
+        cell = self.cell
+        cells = self.cells
+        x0 = int((x - radius) // cell)
+        x1 = int((x + radius) // cell)
+        y0 = int((y - radius) // cell)
+        y1 = int((y + radius) // cell)
+        out: list = []
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    out.extend(bucket)
+        out.sort(key=_order_key)
+        return out
+
+
+def _order_key(entry: tuple) -> int:
+    return entry[0]
+
+
+def enemy_grid(view: Any) -> EnemyGrid:
+    """The tick's :class:`EnemyGrid` (memoized on the view when possible)."""
+    memo = view_tick_memo(view)
+    if memo is not None:
+        grid = memo.get("enemy_grid")
+        if grid is None:
+            grid = EnemyGrid(view.enemies)
+            memo["enemy_grid"] = grid
+        return grid
+    return EnemyGrid(view.enemies)
+
+
+def enemies_within(view: Any, x: float, y: float, radius: float) -> list:
+    """Living enemies with ``distance <= radius`` of ``(x, y)``.
+
+    Returns ``[(enemy, dist), ...]`` in ``view.enemies`` order — the exact list
+    the old per-hero ``for enemy in enemies: if enemy.is_alive ...`` scans built.
+    """
+    out = []
+    for _order, enemy in enemy_grid(view).candidates(x, y, radius):
+        dist = math.sqrt((x - enemy.x) ** 2 + (y - enemy.y) ** 2)
+        if dist <= radius:
+            out.append((enemy, dist))
+    return out
+
+
+def nearest_enemy_within(view: Any, x: float, y: float, radius: float) -> tuple[Any, float]:
+    """``(enemy, dist)`` of the closest living enemy within ``radius``, or ``(None, inf)``.
+
+    Single pass over the grid candidates — no intermediate list, no sort. Same
+    answer as stable-sorting :func:`enemies_within` by distance and taking the
+    head: distances are compared exactly as computed there, and ties keep the
+    first enemy in view order (strict ``<``).
+    """
+    best = None
+    best_dist = math.inf
+    for _order, enemy in enemy_grid(view).candidates(x, y, radius):
+        dist = math.sqrt((x - enemy.x) ** 2 + (y - enemy.y) ** 2)
+        if dist <= radius and dist < best_dist:
+            best = enemy
+            best_dist = dist
+    return best, best_dist
+
+
+def any_enemy_within(view: Any, x: float, y: float, radius: float) -> bool:
+    """True iff some living enemy is within ``radius`` (inclusive) of ``(x, y)``."""
+    for _order, enemy in enemy_grid(view).candidates(x, y, radius):
+        if math.sqrt((x - enemy.x) ** 2 + (y - enemy.y) ** 2) <= radius:
+            return True
+    return False
@@ -15,15 +15,16 @@ from __future__ import annotations
 import math
 from typing import Any
 
-from config import TILE_SIZE
+from config import MAP_HEIGHT, MAP_WIDTH, TILE_SIZE
 
 from ai.behaviors.view_compat import as_ai_view
 
 
 def assign_patrol_zone(ai: Any, hero: Any, view: Any) -> tuple[float, float]:
     """Assign a unique patrol zone to a hero based on their index."""
-    if hero.name in ai.hero_zones:
-        return ai.hero_zones[hero.name]
+    zone = ai.hero_zones.get(hero.name)
+    if zone is not None:
+        return zone
 
     view = as_ai_view(view)
     # Get castle position as reference.
@@ -31,8 +32,6 @@ def assign_patrol_zone(ai: Any, hero: Any, view: Any) -> tuple[float, float]:
     if castle:
         base_x, base_y = castle.center_x, castle.center_y
     else:
-        from config import MAP_HEIGHT, MAP_WIDTH
-
         base_x = (MAP_WIDTH // 2) * TILE_SIZE
         base_y = (MAP_HEIGHT // 2) * TILE_SIZE
 
@@ -51,7 +50,8 @@ def assign_patrol_zone(ai: Any, hero: Any, view: Any) -> tuple[float, float]:
     zone_y = base_y + math.sin(angle) * radius
 
     ai.hero_zones[hero.name] = (zone_x, zone_y)
-    ai._debug_log(
-        f"{hero.name} assigned zone at ({zone_x:.0f}, {zone_y:.0f}), angle={math.degrees(angle):.0f}deg"
-    )
+    if getattr(ai, "debug_enabled", False):
+        ai._debug_log(
+            f"{hero.name} assigned zone at ({zone_x:.0f}, {zone_y:.0f}), angle={math.degrees(angle):.0f}deg"
+        )
     return (zone_x, zone_y)
@@ -12,6 +12,9 @@ from ai.quest_chain_context import (
 from ai.rescue_revenge_context import summarize_story_facts
 from game.sim.timebase import now_ms as sim_now_ms
 
+# Guilds whose distance is reported under their own building-type key.
+_GUILD_BUILDING_TYPES = frozenset({"warrior_guild", "ranger_guild", "rogue_guild", "wizard_guild"})
+
 
 class ContextBuilder:
     """Builds structured context for LLM prompts."""
@@ -196,10 +199,11 @@ class ContextBuilder:
         # Add building distances and shop items
         for building in game_state.get("buildings", []):
             dist = hero.distance_to(building.center_x, building.center_y)
-            
-            if building.building_type == "castle":
+            btype = building.building_type
+
+            if btype == "castle":
                 context["distances"]["castle"] = round(dist / TILE_SIZE, 1)
-            elif building.building_type == "marketplace":
+            elif btype == "marketplace":
                 context["distances"]["marketplace"] = round(dist / TILE_SIZE, 1)
                 if dist < TILE_SIZE * 6:
                     context["shop_items"] = [
@@ -211,13 +215,8 @@ class ContextBuilder:
                         }
                         for item in building.get_available_items()
                     ]
-            elif building.building_type in (
-                "warrior_guild",
-                "ranger_guild",
-                "rogue_guild",
-                "wizard_guild",
-            ):
-                context["distances"][building.building_type] = round(dist / TILE_SIZE, 1)
+            elif btype in _GUILD_BUILDING_TYPES:
+                context["distances"][btype] = round(dist / TILE_SIZE, 1)
 
         # WK55: Nearby POI awareness for LLM decisions (discovered + seen-fog unknowns).
         from ai.behaviors.poi_awareness import get_nearby_pois_for_hero
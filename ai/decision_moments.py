@@ -6,6 +6,7 @@ Pure policy helpers: sim-time only, no pygame/UI, no hero mutation.
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
@@ -26,6 +27,9 @@ _MOMENT_LOSS_RECENT = 0.25  # lost >= 25% max HP since full
 _MOMENT_SHOP_GOLD_MIN = 30
 _MOMENT_NEAR_SHOP_TILES = 6
 _POST_COMBAT_MEMORY_MS = 120_000
+_NEAR_SAFETY_SQ = (TILE_SIZE * 5) ** 2
+_NEAR_SHOP_SQ = (TILE_SIZE * _MOMENT_NEAR_SHOP_TILES) ** 2
+_IDLE_AWARENESS_SQ = (TILE_SIZE * 5) ** 2
 _NEAR_ENEMY_POST_COMBAT_TILES = 3.0
 
 
@@ -93,16 +97,24 @@ def _has_live_enemy_target(hero: Any) -> bool:
 
 
 def _nearest_enemy_tiles(hero: Any, game_state: dict) -> float | None:
-    best: float | None = None
+    # Compare squared distances; a single sqrt for the winner.
+    hx = float(hero.x)
+    hy = float(hero.y)
+    best_d2: float | None = None
     for enemy in game_state.get("enemies", []) or []:
         if not getattr(enemy, "is_alive", False):
             continue
         try:
-            d = float(hero.distance_to(enemy.x, enemy.y)) / float(TILE_SIZE or 1)
+            dx = hx - float(enemy.x)
+            dy = hy - float(enemy.y)
         except Exception:
             continue
-        best = d if best is None else min(best, d)
-    return best
+        d2 = dx * dx + dy * dy
+        if best_d2 is None or d2 < best_d2:
+            best_d2 = d2
+    if best_d2 is None:
+        return None
+    return math.sqrt(best_d2) / float(TILE_SIZE or 1)
 
 
 def _recent_combat_memory(hero: Any, now_ms: int) -> bool:
@@ -142,7 +154,9 @@ def _near_safety(hero: Any, game_state: dict) -> bool:
         if str(bt or "").lower() not in {"castle", "inn", "marketplace"}:
             continue
         try:
-            if hero.distance_to(building.center_x, building.center_y) < TILE_SIZE * 5:
+            dx = hero.x - building.center_x
+            dy = hero.y - building.center_y
+            if dx * dx + dy * dy < _NEAR_SAFETY_SQ:
                 return True
         except Exception:
             continue
@@ -180,7 +194,9 @@ def _near_marketplace(hero: Any, game_state: dict) -> bool:
         if getattr(b, "building_type", None) != "marketplace":
             continue
         try:
-            if hero.distance_to(b.center_x, b.center_y) < TILE_SIZE * _MOMENT_NEAR_SHOP_TILES:
+            dx = hero.x - b.center_x
+            dy = hero.y - b.center_y
+            if dx * dx + dy * dy < _NEAR_SHOP_SQ:
                 return True
         except Exception:
             continue
@@ -381,15 +397,18 @@ def moment_idle_seeking_activity(hero: Any, game_state: dict) -> DecisionMoment
         return None
     if getattr(hero, "target_position", None) is not None:
         return None
-    awareness_radius = TILE_SIZE * 5
+    hx = float(hero.x)
+    hy = float(hero.y)
     for enemy in game_state.get("enemies", []) or []:
         if not getattr(enemy, "is_alive", False):
             continue
         try:
-            if hero.distance_to(enemy.x, enemy.y) <= awareness_radius:
-                return None
+            dx = hx - float(enemy.x)
+            dy = hy - float(enemy.y)
         except Exception:
             continue
+        if dx * dx + dy * dy <= _IDLE_AWARENESS_SQ:
+            return None
     return DecisionMoment(
         moment_type=DecisionMomentType.IDLE_SEEKING_ACTIVITY,
         urgency=0,
@@ -413,10 +432,12 @@ def moment_shopping_opportunity(hero: Any, game_state: dict) -> DecisionMoment |
         gold = 0
     if gold < _MOMENT_SHOP_GOLD_MIN:
         return None
-    if not _near_marketplace(hero, game_state):
-        return None
+    # Both remaining gates are pure predicates; the hero-only need check runs
+    # before the building scan so heroes with nothing to buy skip it.
     if not _shopping_need(hero):
         return None
+    if not _near_marketplace(hero, game_state):
+        return None
 
     return DecisionMoment(
         moment_type=DecisionMomentType.SHOPPING_OPPORTUNITY,
@@ -2,6 +2,7 @@
 LLM Brain - coordinates LLM decision making for heroes.
 Uses async calls to prevent blocking the game loop.
 """
+import itertools
 import json
 import threading
 import queue
@@ -21,7 +22,7 @@ from ai.prompt_templates import (
     AUTONOMOUS_ONLY_ACTIONS,
     get_fallback_decision,
 )
-from config import LLM_PROVIDER, LLM_TIMEOUT, CONVERSATION_TIMEOUT
+from config import LLM_PROVIDER, LLM_TIMEOUT, LLM_WORKER_THREADS, CONVERSATION_TIMEOUT
 
 # WK18: Optional event bus for dev tools — capture LLM prompts/responses (game.events is safe to import here).
 try:
@@ -29,6 +30,29 @@ try:
 except ImportError:
     GameEventType = None
 
+# Request queue priorities (lower runs first). Autonomous decisions use
+# -moment.urgency (0..2), so a critical-HP combat consult overtakes queued
+# idle/shopping moments; a player chat is served ahead of them.
+_CONVERSATION_PRIORITY = -3
+_DEFAULT_DECISION_PRIORITY = 0
+# Aging: one priority step is worth this many enqueues. A request is only
+# overtaken by more urgent ones enqueued within ``gap * _PRIORITY_AGING_SEQ``
+# requests after it, so a steady stream of urgent consults cannot starve an
+# idle moment until the pending-decision watchdog abandons it.
+_PRIORITY_AGING_SEQ = 8
+
+
+def _decision_priority(context: dict) -> int:
+    """Queue priority for a decision request: ``-urgency`` of its WK50 moment."""
+    aut = context.get("wk50_autonomous") if isinstance(context, dict) else None
+    moment = aut.get("moment") if isinstance(aut, dict) else None
+    if not isinstance(moment, dict):
+        return _DEFAULT_DECISION_PRIORITY
+    try:
+        return -int(moment.get("urgency", 0) or 0)
+    except (TypeError, ValueError):
+        return _DEFAULT_DECISION_PRIORITY
+
 
 class LLMBrain:
     """
@@ -36,7 +60,7 @@ class LLMBrain:
     Uses a separate thread for API calls to avoid blocking.
     """
     
-    def __init__(self, provider_name: str = None):
+    def __init__(self, provider_name: str = None, autostart: bool = True):
         self.provider_name = provider_name or LLM_PROVIDER
         # WK134: loud provider-fallback signal. True when the REQUESTED provider
         # could not be used and MockProvider was substituted; readable by UI
@@ -46,8 +70,11 @@ class LLMBrain:
         self._fallback_notice_sent = False
         self.provider = self._create_provider()
         
-        # Request queue: (hero_key, context) or (hero_key, payload, mode) for conversation
-        self.request_queue = queue.Queue()
+        # Request queue: (rank, seq, item) where item is (hero_key, context)
+        # or (hero_key, payload, mode) for conversation. ``rank`` is the aged
+        # priority (see _enqueue); ``seq`` breaks ties first-come first-served.
+        self.request_queue = queue.PriorityQueue()
+        self._request_seq = itertools.count()
         
         # Response storage: hero_key -> decision
         self.responses = {}
@@ -55,15 +82,17 @@ class LLMBrain:
         self.conversation_responses = {}
         self.response_lock = threading.Lock()
         
-        # Background worker thread
+        # Background worker threads (LLM_WORKER_THREADS; worker_thread is the first)
         self.worker_thread = None
+        self.worker_threads = []
         self.running = False
         
         # WK18: Optional event bus for AI monitoring dev tools (set by engine/main).
         self._event_bus = None
         
-        # Start the worker
-        self.start()
+        # Start the workers (``autostart=False``: the owner calls drain_pending)
+        if autostart:
+            self.start()
     
     def set_event_bus(self, event_bus) -> None:
         """Set EventBus for emitting LLM prompt/response events (called by engine/main)."""
@@ -138,64 +167,96 @@ class LLMBrain:
         return provider
     
     def start(self):
-        """Start the background worker thread."""
+        """Start the background worker threads.
+
+        Every worker pulls from the one request queue and publishes into the
+        shared response maps, so with ``LLM_WORKER_THREADS > 1`` several heroes'
+        provider calls overlap instead of queueing behind each other. The game
+        thread only ever enqueues and polls, never waits on a provider.
+        """
         if self.running:
             return
         
         self.running = True
-        self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
-        self.worker_thread.start()
+        self.worker_threads = [
+            threading.Thread(target=self._worker_loop, daemon=True)
+            for _ in range(max(1, int(LLM_WORKER_THREADS)))
+        ]
+        self.worker_thread = self.worker_threads[0]
+        for worker in self.worker_threads:
+            worker.start()
     
     def stop(self):
-        """Stop the background worker."""
+        """Stop the background workers."""
         self.running = False
-        if self.worker_thread:
-            self.worker_thread.join(timeout=2.0)
+        for worker in self.worker_threads:
+            worker.join(timeout=2.0)
     
     def _worker_loop(self):
         """Background worker that processes LLM requests (decision or conversation)."""
         while self.running:
-            hero_key = None
-            mode = None
-            context = None
             try:
-                item = self.request_queue.get(timeout=0.5)
-                if len(item) == 2:
-                    hero_key, context = item
-                    mode = "decision"
-                else:
-                    hero_key, payload, mode = item
-                    context = payload
-
-                if mode == "conversation":
-                    text = self._process_conversation(hero_key, context)
-                    with self.response_lock:
-                        self.conversation_responses[hero_key] = text
-                else:
-                    decision = self._process_request(hero_key, context)
-                    with self.response_lock:
-                        self.responses[hero_key] = decision
+                _rank, _seq, item = self.request_queue.get(timeout=0.5)
             except queue.Empty:
                 continue
-            except Exception as e:
-                print(f"LLM worker error: {e}")
-                if hero_key and mode == "conversation":
-                    hc = {}
-                    pm = ""
-                    if isinstance(context, dict):
-                        hc = context.get("hero_context") or {}
-                        pm = str(context.get("player_message") or "")
-                    with self.response_lock:
-                        self.conversation_responses[hero_key] = validate_direct_prompt_output(
-                            {
-                                "spoken_response": "I'm at a loss for words right now.",
-                                "interpreted_intent": "no_action_chat_only",
-                                "tool_action": None,
-                            },
-                            hc,
-                            pm,
-                        )
-    
+            self._serve_request(item)
+
+    def drain_pending(self) -> int:
+        """Serve every queued request on the calling thread; returns how many.
+
+        For a brain built with ``autostart=False`` (headless soaks / tests): the
+        caller drains once per tick, so answers land on a fixed tick in queue
+        order instead of whenever a worker thread gets scheduled.
+        """
+        served = 0
+        while True:
+            try:
+                _rank, _seq, item = self.request_queue.get_nowait()
+            except queue.Empty:
+                return served
+            self._serve_request(item)
+            served += 1
+
+    def _serve_request(self, item: tuple) -> None:
+        """Run one queued request and publish its answer into the response maps."""
+        hero_key = None
+        mode = None
+        context = None
+        try:
+            if len(item) == 2:
+                hero_key, context = item
+                mode = "decision"
+            else:
+                hero_key, payload, mode = item
+                context = payload
+
+            if mode == "conversation":
+                text = self._process_conversation(hero_key, context)
+                with self.response_lock:
+                    self.conversation_responses[hero_key] = text
+            else:
+                decision = self._process_request(hero_key, context)
+                with self.response_lock:
+                    self.responses[hero_key] = decision
+        except Exception as e:
+            print(f"LLM worker error: {e}")
+            if hero_key and mode == "conversation":
+                hc = {}
+                pm = ""
+                if isinstance(context, dict):
+                    hc = context.get("hero_context") or {}
+                    pm = str(context.get("player_message") or "")
+                with self.response_lock:
+                    self.conversation_responses[hero_key] = validate_direct_prompt_output(
+                        {
+                            "spoken_response": "I'm at a loss for words right now.",
+                            "interpreted_intent": "no_action_chat_only",
+                            "tool_action": None,
+                        },
+                        hc,
+                        pm,
+                    )
+
     def _process_request(self, hero_key, context: dict) -> dict:
         """Process a single LLM request. WK65: legacy non-autonomous decision-prompt
         path removed (llm_bridge always sets wk50_autonomous); fall back safely if absent."""
@@ -373,8 +434,8 @@ class LLMBrain:
             )
 
     def request_decision(self, hero_key, context: dict):
-        """Queue a decision request for a hero."""
-        self.request_queue.put((hero_key, context))
+        """Queue a decision request for a hero (more urgent moments are served first)."""
+        self._enqueue(_decision_priority(context), (hero_key, context))
 
     def request_conversation(
         self,
@@ -389,7 +450,11 @@ class LLMBrain:
             "conversation_history": conversation_history,
             "player_message": player_message,
         }
-        self.request_queue.put((hero_key, payload, "conversation"))
+        self._enqueue(_CONVERSATION_PRIORITY, (hero_key, payload, "conversation"))
+
+    def _enqueue(self, priority: int, item: tuple) -> None:
+        seq = next(self._request_seq)
+        self.request_queue.put((seq + priority * _PRIORITY_AGING_SEQ, seq, item))
 
     def get_conversation_response(self, hero_key) -> Optional[dict]:
         """Get and consume a conversation response for the hero, if ready."""
@@ -397,7 +462,16 @@ class LLMBrain:
             return self.conversation_responses.pop(hero_key, None)
     
     def get_decision(self, hero_key) -> Optional[dict]:
-        """Get a decision for a hero if one is ready."""
+        """Get a decision for a hero if one is ready.
+
+        Polled every tick for every hero with ``pending_llm_decision`` set, and
+        almost always a miss. The miss is answered without taking
+        ``response_lock``: the worker only ever inserts into ``responses`` and a
+        dict membership test is atomic under the GIL, so a racing insert is
+        simply picked up on the next tick. Hits still pop under the lock.
+        """
+        if hero_key not in self.responses:
+            return None
         with self.response_lock:
             return self.responses.pop(hero_key, None)
     
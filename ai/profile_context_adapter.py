@@ -101,8 +101,9 @@ def _filter_recent_memory(snapshot: HeroProfileSnapshot, moment: DecisionMoment)
     return out
 
 
-def _compact_situation(hero: Any, game_state: dict) -> dict[str, Any]:
-    full = ContextBuilder.build_hero_context(hero, game_state)
+def _compact_situation(hero: Any, game_state: dict, full: dict | None = None) -> dict[str, Any]:
+    if full is None:
+        full = ContextBuilder.build_hero_context(hero, game_state)
     enemies = list(full.get("nearby_enemies") or [])[:_MAX_ENEMIES]
     allies = list(full.get("nearby_allies") or [])[:_MAX_ALLIES]
     bounties = list(full.get("bounty_options") or [])[:_MAX_BOUNTIES]
@@ -187,13 +188,20 @@ def build_llm_context_for_moment(
     moment: DecisionMoment,
     *,
     now_ms: int | None = None,
+    hero_context: dict | None = None,
 ) -> dict[str, Any]:
+    """Autonomous prompt block for ``moment``.
+
+    ``hero_context`` is the caller's ``ContextBuilder.build_hero_context`` result
+    for the same hero and ``game_state``, when it already has one (the consult
+    path does) — saves rebuilding the full context just to compact it.
+    """
     snapshot = build_hero_profile_snapshot(hero, None, now_ms=now_ms)
     profile_core = _compact_profile_dict(snapshot)
     out = {
         "moment": moment.to_prompt_dict(),
         "hero_profile": profile_core,
-        "current_situation": _compact_situation(hero, game_state),
+        "current_situation": _compact_situation(hero, game_state, hero_context),
         "known_places": _filter_known_places(snapshot, moment),
         "recent_memory": _filter_recent_memory(snapshot, moment),
         "allowed_actions": list(moment.allowed_actions),
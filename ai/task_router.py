@@ -8,11 +8,11 @@ behavior-affecting enhancement (it would shift the WK67 digest) and is intention
 done here — see the WK120 plan §0."""
 from __future__ import annotations
 
-from ai.behaviors import bounty_pursuit, quest_offer
-from ai.behaviors.view_compat import as_ai_view, view_to_legacy_context
+from ai.behaviors import bounty_pursuit, quest_offer, tick_index
+from ai.behaviors.view_compat import as_ai_view
 from ai.context_builder import ContextBuilder
 from ai.prompt_templates import get_fallback_decision
-from config import TILE_SIZE
+from config import AI_RESTING_POLL_MS, TILE_SIZE
 from game.entities.hero import HeroState
 from game.sim.direct_prompt_commit import (
     clear_direct_prompt_commit,
@@ -29,17 +29,85 @@ from game.sim.timebase import now_ms as sim_now_ms
 # (8s wall) even at 2x sim speed.
 PENDING_LLM_DECISION_TIMEOUT_MS = 20_000
 
+# Cooperative cadence for RESTING heroes (opt-in; 0 = poll every tick). A resting
+# hero's per-tick work is just handle_resting; with a cadence the skipped ticks'
+# dt is banked and applied in one call, so heal / inn-fee / rest-timer totals are
+# preserved. Threats bypass it: the castle alarm and deferred-task finalize run
+# above the RESTING branch every tick, and a rest building that is under attack
+# or damaged is polled immediately. Off by default because poll granularity
+# shifts the tick on which a rest ends (and therefore the WK67 digest).
+RESTING_POLL_INTERVAL_MS = AI_RESTING_POLL_MS
+
+# HeroState members resolved once at import: every ``HeroState.X`` read goes
+# through the Enum metaclass (~5x the cost of a module global), and the priority
+# ladder below compares the hero's state about ten times per hero per tick.
+_IDLE = HeroState.IDLE
+_FIGHTING = HeroState.FIGHTING
+_RESTING = HeroState.RESTING
+_CAPTURED = HeroState.CAPTURED
+_NO_MEAL_STATES = (HeroState.RETREATING, HeroState.DEAD)
+
+# State -> BasicAI handler for the state-machine step (one dict lookup instead of
+# an if/elif chain). RESTING is handled (and returns) further up. Handlers are
+# looked up by name on ``ai`` each call so subclasses / patched instances keep
+# overriding them as before.
+_STATE_HANDLERS = {
+    HeroState.IDLE: "handle_idle",
+    HeroState.MOVING: "handle_moving",
+    HeroState.FIGHTING: "handle_fighting",
+    HeroState.RETREATING: "handle_retreating",
+    HeroState.SHOPPING: "handle_shopping",
+}
+
+
+def _resting_poll_dt(hero, dt: float, now_ms: int) -> float | None:
+    """dt to hand ``handle_resting`` this tick, or None to skip (dt is banked)."""
+    interval = RESTING_POLL_INTERVAL_MS
+    if interval <= 0:
+        return dt
+    next_poll = int(getattr(hero, "_next_rest_poll_ms", 0) or 0)
+    banked = float(getattr(hero, "_rest_banked_dt", 0.0) or 0.0)
+    if now_ms >= next_poll + interval:
+        banked = 0.0  # missed a whole interval: a new rest episode, drop stale bank
+    banked += dt
+    rest_building = hero.inside_building or hero.home_building
+    threatened = rest_building is not None and (
+        getattr(rest_building, "is_under_attack", False) or getattr(rest_building, "is_damaged", False)
+    )
+    if not threatened and now_ms < next_poll:
+        hero._rest_banked_dt = banked
+        return None
+    hero._rest_banked_dt = 0.0
+    hero._next_rest_poll_ms = now_ms + interval
+    return banked
+
+
+def _clear_resting_poll(hero) -> None:
+    """Forget the rest cadence once the hero is out of RESTING.
+
+    The bank belongs to one rest episode; without this, dt banked just before the
+    hero left would be credited to the next episode's first poll.
+    """
+    if getattr(hero, "_rest_banked_dt", 0.0) or getattr(hero, "_next_rest_poll_ms", 0):
+        hero._rest_banked_dt = 0.0
+        hero._next_rest_poll_ms = 0
+
 
 def update_hero(ai, hero, dt: float, view) -> None:
     """Update AI for a single hero."""
     # WK67 Move 5: the sim drives this with an AiGameView. A few callers/tests
     # may still pass the legacy game_state dict; normalize to the view surface.
     view = as_ai_view(view)
+    # Sim time is frozen for the whole AI pass: read the clock once per hero and
+    # hand the same value to every gate below (and to the LLM bridge).
+    now_ms = sim_now_ms()
+    if RESTING_POLL_INTERVAL_MS > 0 and hero.state != _RESTING:
+        _clear_resting_poll(hero)
     # Keep intent non-empty even if we make no decision this tick.
     ai.refresh_intent(hero, view)
     expire_direct_prompt_commit_if_timed_out(hero)
 
-    if getattr(hero, "is_captured", False) or hero.state == HeroState.CAPTURED:
+    if getattr(hero, "is_captured", False) or hero.state == _CAPTURED:
         hero.pending_llm_decision = False
         return
 
@@ -66,11 +134,13 @@ def update_hero(ai, hero, dt: float, view) -> None:
             return
 
     # Handle resting state first (doesn't need LLM).
-    if hero.state == HeroState.RESTING:
-        if bounty_pursuit.bounty_commitment_active(hero, view, now_ms=sim_now_ms()):
+    if hero.state == _RESTING:
+        if bounty_pursuit.bounty_commitment_active(hero, view, now_ms=now_ms):
             if ai.bounty_behavior.resume_committed_bounty(ai, hero, view):
                 return
-        ai.handle_resting(hero, dt, view)
+        rest_dt = _resting_poll_dt(hero, dt, now_ms)
+        if rest_dt is not None:
+            ai.handle_resting(hero, rest_dt, view)
         return
 
     # Priority: defend castle when actually threatened (unless already fighting).
@@ -83,14 +153,14 @@ def update_hero(ai, hero, dt: float, view) -> None:
     if (
         castle
         and ai.defense_behavior.building_threatened(view, castle, 6)
-        and hero.state != HeroState.FIGHTING
+        and hero.state != _FIGHTING
     ):
         clear_direct_prompt_commit(hero)
         ai.defense_behavior.defend_castle(ai, hero, view, castle)
         return
 
     # WK15: Warriors prioritize defending economic buildings (farm, food_stand) under attack.
-    if hero.state != HeroState.FIGHTING and getattr(hero, "hero_class", "") == "warrior":
+    if hero.state != _FIGHTING and getattr(hero, "hero_class", "") == "warrior":
         if ai.defense_behavior.defend_economic_building_warrior(ai, hero, view):
             return
 
@@ -98,7 +168,7 @@ def update_hero(ai, hero, dt: float, view) -> None:
     # (no takeover, no state change) when no ally needs support, so the cleric
     # falls through to her default behavior. This is inert in the WK67 digest
     # scenario (nobody wounded, no combat) → digest byte-identical. Class-gated.
-    if hero.state != HeroState.FIGHTING and getattr(hero, "hero_class", "") == "cleric":
+    if hero.state != _FIGHTING and getattr(hero, "hero_class", "") == "cleric":
         if ai.support_behavior.cleric_seek_and_support(ai, hero, view):
             return
 
@@ -109,18 +179,18 @@ def update_hero(ai, hero, dt: float, view) -> None:
     if (
         hero.home_building
         and ai.defense_behavior.building_threatened(view, hero.home_building, 5)
-        and hero.state != HeroState.FIGHTING
+        and hero.state != _FIGHTING
     ):
         ai.defense_behavior.defend_home_building(ai, hero, view)
         return
 
     # Priority: defend nearby neutral buildings if under attack.
-    if hero.state != HeroState.FIGHTING:
+    if hero.state != _FIGHTING:
         if ai.defense_behavior.defend_neutral_building_if_visible(ai, hero, view):
             return
 
     # WK61-R12: hunger meals for all non-retreating heroes (including FIGHTING when HP > critical).
-    if hero.state not in (HeroState.RETREATING, HeroState.DEAD):
+    if hero.state not in _NO_MEAL_STATES:
         if ai.hunger_behavior.tick_meal_hunger(ai, hero, view):
             target = getattr(hero, "target", None)
             if isinstance(target, dict) and target.get("type") == "buy_meal":
@@ -128,29 +198,26 @@ def update_hero(ai, hero, dt: float, view) -> None:
 
     # Healthy heroes with a live bounty commitment should keep that promise
     # before any passive rest/home handling can steal the tick.
-    if hero.state == HeroState.IDLE:
-        if bounty_pursuit.bounty_commitment_active(hero, view, now_ms=sim_now_ms()):
+    if hero.state == _IDLE:
+        if bounty_pursuit.bounty_commitment_active(hero, view, now_ms=now_ms):
             if ai.bounty_behavior.resume_committed_bounty(ai, hero, view):
                 return
 
     # Check if hero should go home to rest (priority check, only if home is safe).
-    if hero.state == HeroState.IDLE and hero.should_go_home_to_rest():
+    if hero.state == _IDLE and hero.should_go_home_to_rest():
         if hero.can_rest_at_home():
             if ai.bounty_behavior.resume_committed_bounty(ai, hero, view):
                 return
             # Bugfix v1.3.4: don't route to Inn/home to rest if enemies are nearby
             # and the hero isn't critically low HP. Let the state machine engage instead.
-            enemies = view.enemies
             combat_guard_radius = TILE_SIZE * 5  # ~5 tiles / 160px
-            enemies_nearby = any(
-                getattr(e, "is_alive", False) and hero.distance_to(e.x, e.y) <= combat_guard_radius
-                for e in enemies
-            )
+            enemies_nearby = tick_index.any_enemy_within(view, hero.x, hero.y, combat_guard_radius)
             if enemies_nearby and hero.health_percent > 0.25:
-                ai._debug_log(
-                    f"{hero.name} -> skipping rest (enemies nearby, hp={hero.health_percent:.0%})",
-                    throttle_key=f"{hero.name}_skip_rest_enemy",
-                )
+                if getattr(ai, "debug_enabled", False):
+                    ai._debug_log(
+                        f"{hero.name} -> skipping rest (enemies nearby, hp={hero.health_percent:.0%})",
+                        throttle_key=f"{hero.name}_skip_rest_enemy",
+                    )
             else:
                 ai.send_home_to_rest(hero, view)
                 return
@@ -158,13 +225,13 @@ def update_hero(ai, hero, dt: float, view) -> None:
     # WK17: Intent conviction — do not consult or apply LLM when hero is committed to a destination.
     if not ai._is_committed_destination(hero):
         # Check if we need an LLM decision.
-        if ai.llm_bridge_behavior.should_consult_llm(ai, hero, view):
+        if ai.llm_bridge_behavior.should_consult_llm(ai, hero, view, now_ms=now_ms):
             # If no LLM brain is wired, still choose via deterministic fallback so
             # the no-LLM path produces stable intent/decision logging.
             if ai.llm_brain:
-                ai.llm_bridge_behavior.request_llm_decision(ai, hero, view)
+                ai.llm_bridge_behavior.request_llm_decision(ai, hero, view, now_ms=now_ms)
             else:
-                context = ContextBuilder.build_hero_context(hero, view_to_legacy_context(view))
+                context = ContextBuilder.build_hero_context(hero, tick_index.legacy_context(view))
                 decision = get_fallback_decision(context)
                 ai.llm_bridge_behavior.apply_llm_decision(
                     ai,
@@ -179,7 +246,7 @@ def update_hero(ai, hero, dt: float, view) -> None:
         if hero.pending_llm_decision and ai.llm_brain:
             decision = ai.llm_brain.get_decision(hero.name)
             if decision:
-                context = ContextBuilder.build_hero_context(hero, view_to_legacy_context(view))
+                context = ContextBuilder.build_hero_context(hero, tick_index.legacy_context(view))
                 src = "mock" if getattr(ai.llm_brain, "provider_name", None) == "mock" else "llm"
                 ai.llm_bridge_behavior.apply_llm_decision(
                     ai, hero, decision, view, source=src, context=context
@@ -189,7 +256,7 @@ def update_hero(ai, hero, dt: float, view) -> None:
                 # WK134 watchdog: never let a hung provider wedge this hero —
                 # pending_llm_decision must ALWAYS clear (see constant above).
                 last = int(getattr(hero, "last_llm_decision_time", 0) or 0)
-                if sim_now_ms() - last > PENDING_LLM_DECISION_TIMEOUT_MS:
+                if now_ms - last > PENDING_LLM_DECISION_TIMEOUT_MS:
                     hero.pending_llm_decision = False
                     ai._debug_log(
                         f"{hero.name} -> abandoned stale LLM request (> "
@@ -202,16 +269,9 @@ def update_hero(ai, hero, dt: float, view) -> None:
             hero.pending_llm_decision = False
 
     # State machine behavior.
-    if hero.state == HeroState.IDLE:
-        ai.handle_idle(hero, view)
-    elif hero.state == HeroState.MOVING:
-        ai.handle_moving(hero, view)
-    elif hero.state == HeroState.FIGHTING:
-        ai.handle_fighting(hero, view)
-    elif hero.state == HeroState.RETREATING:
-        ai.handle_retreating(hero, view)
-    elif hero.state == HeroState.SHOPPING:
-        ai.handle_shopping(hero, view)
+    handler_name = _STATE_HANDLERS.get(hero.state)
+    if handler_name is not None:
+        getattr(ai, handler_name)(hero, view)
 
     # WK126-T5: LOWEST-priority tier — occasional walk to an open quest-giver.
     # Runs AFTER the state dispatch so every higher tier (survival, defense,
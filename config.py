@@ -436,6 +436,13 @@ GROK_API_KEY = os.getenv("GROK_API_KEY", "")
 # LLM decision settings
 LLM_DECISION_COOLDOWN = 2000
 LLM_TIMEOUT = 5.0
+# Background LLM worker threads pulling from the shared request queue. 1 keeps
+# requests strictly serialized (and the mock provider's RNG draws in a fixed
+# order); raise it so several heroes' network-bound requests are in flight at once.
+LLM_WORKER_THREADS = max(1, int(os.getenv("LLM_WORKER_THREADS", "1") or 1))
+# Cooperative poll cadence (sim-ms) for RESTING heroes' AI; 0 = poll every tick.
+# See ai/task_router.py for why it is off by default.
+AI_RESTING_POLL_MS = max(0, int(os.getenv("KINGDOM_AI_RESTING_POLL_MS", "0") or 0))
 HEALTH_THRESHOLD_FOR_DECISION = 0.5
 
 # wk14 Persona and Presence: conversation mode
@@ -27,6 +27,18 @@ if TYPE_CHECKING:
     from game.entities.hero import Hero
 
 
+def group_items_by_type(items: list) -> dict[str, list]:
+    """Group a shop catalogue by ``item["type"]``, keeping shop order per type."""
+    by_type: dict[str, list] = {}
+    for item in items:
+        bucket = by_type.get(item["type"])
+        if bucket is None:
+            by_type[item["type"]] = [item]
+        else:
+            bucket.append(item)
+    return by_type
+
+
 class Marketplace(TaxStashMixin, Building):
     """Building where heroes can buy items."""
 
@@ -49,6 +61,20 @@ class Marketplace(TaxStashMixin, Building):
             items.insert(0, items_registry.to_shop_dict("healing_potion", price=self.potion_price))
         return items
 
+    def get_items_by_type(self) -> dict[str, list]:
+        """``get_available_items()`` grouped by item type (read-only, shared).
+
+        Cached until potion research or the potion price changes, so each
+        hero's shopping trip reads ready-made buckets instead of rebuilding and
+        re-scanning the catalogue.
+        """
+        key = (self.potions_researched, self.potion_price)
+        cached = getattr(self, "_items_by_type_cache", None)
+        if cached is None or cached[0] != key:
+            cached = (key, group_items_by_type(self.get_available_items()))
+            self._items_by_type_cache = cached
+        return cached[1]
+
     def can_sell_potions(self) -> bool:
         """Check if marketplace can sell potions."""
         return self.potions_researched
@@ -205,6 +231,19 @@ class Blacksmith(TaxStashMixin, Building):
 
         return items
 
+    def get_items_by_type(self) -> dict[str, list]:
+        """``get_available_items()`` grouped by item type (read-only, shared).
+
+        Cached per research-unlock state; unlocking weapon or armor upgrades
+        rebuilds the buckets on the next call.
+        """
+        key = (is_research_unlocked("Weapon Upgrades"), is_research_unlocked("Armor Upgrades"))
+        cached = getattr(self, "_items_by_type_cache", None)
+        if cached is None or cached[0] != key:
+            cached = (key, group_items_by_type(self.get_available_items()))
+            self._items_by_type_cache = cached
+        return cached[1]
+
     def has_upgrades_available(self) -> bool:
         """Check if any upgrades are available (researched and affordable for heroes)."""
         return is_research_unlocked("Weapon Upgrades") or is_research_unlocked("Armor Upgrades")
@@ -56,8 +56,10 @@ class HeroEconomyMixin:
             return False
         if self.is_inside_building and self.inside_building is food_stand:
             return True
-        dist = self.distance_to(float(food_stand.center_x), float(food_stand.center_y))
-        return dist <= TILE_SIZE * 1.0
+        reach = TILE_SIZE * 1.0
+        dx = self.x - float(food_stand.center_x)
+        dy = self.y - float(food_stand.center_y)
+        return dx * dx + dy * dy <= reach * reach
 
     def buy_meal_at_food_stand(self, food_stand: "Building | None") -> bool:
         """Buy a meal at a food stand; deposits sale tax to the stand stash."""
@@ -2,25 +2,36 @@
 Simple A* pathfinding implementation.
 WK17: Bounded path cache to reduce allocation churn (memory leak mitigation).
 WK59: Perf pass — cached blocked tiles, larger path cache, reduced expansions for long paths.
+Path-cache entries are tagged with the blocked-set version they were planned
+against, so a hit under an unchanged building layout skips the per-cell
+blocked re-check (terrain walkability is still re-validated: trees grow back
+without any map-version signal, so an unconditional memo would go stale).
 """
 import heapq
 from config import TILE_SIZE
 
-# Bounded path cache: key (start, goal) -> path. FIFO eviction.
-_PATH_CACHE: dict[tuple[tuple[int, int], tuple[int, int]], list] = {}
+# Bounded path cache: key (start, goal) -> (path, blocked_version). FIFO eviction.
+_PATH_CACHE: dict[tuple[tuple[int, int], tuple[int, int]], tuple[tuple, int]] = {}
 _PATH_CACHE_MAX = 1024
 
 # Cached blocked tiles set — rebuilt only when building count/hp changes.
 _BLOCKED_CACHE: set[tuple[int, int]] = set()
 _BLOCKED_CACHE_KEY: tuple = ()
+# Bumped whenever _BLOCKED_CACHE is replaced; _NO_BLOCKED_VERSION tags paths
+# planned with no buildings (empty blocked set).
+_BLOCKED_VERSION = 0
+_NO_BLOCKED_VERSION = -1
+
+_HALF_TILE = TILE_SIZE // 2
 
 
 def _rebuild_blocked_cache(buildings: list) -> set[tuple[int, int]]:
     """Rebuild the blocked tiles set from buildings and cache it."""
-    global _BLOCKED_CACHE, _BLOCKED_CACHE_KEY
+    global _BLOCKED_CACHE, _BLOCKED_CACHE_KEY, _BLOCKED_VERSION
     if not buildings:
         _BLOCKED_CACHE = set()
         _BLOCKED_CACHE_KEY = ()
+        _BLOCKED_VERSION += 1
         return _BLOCKED_CACHE
 
     cache_key = (
@@ -44,6 +55,7 @@ def _rebuild_blocked_cache(buildings: list) -> set[tuple[int, int]]:
                 blocked.add((gx + dx, gy + dy))
     _BLOCKED_CACHE = blocked
     _BLOCKED_CACHE_KEY = cache_key
+    _BLOCKED_VERSION += 1
     return blocked
 
 
@@ -81,6 +93,45 @@ def get_neighbors(pos: tuple, world) -> list:
     return neighbors
 
 
+_ORTHOGONAL_STEPS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+_DIAGONAL_STEPS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+class _WalkableMemo(dict):
+    """Per-search memo of ``world.is_walkable`` keyed by tile.
+
+    Terrain is static for the duration of one A* search, yet every expanded
+    node re-asks up to 12 walkability questions (8 neighbours plus the two
+    orthogonal corner checks per diagonal) about tiles its neighbours already
+    asked about. The memo answers repeats with one dict lookup.
+    """
+
+    __slots__ = ("_is_walkable",)
+
+    def __init__(self, world):
+        super().__init__()
+        self._is_walkable = world.is_walkable
+
+    def __missing__(self, tile):
+        ok = self[tile] = bool(self._is_walkable(tile[0], tile[1]))
+        return ok
+
+
+def _memo_neighbors(pos: tuple, walkable: _WalkableMemo) -> list:
+    """``get_neighbors`` over a :class:`_WalkableMemo` (same tiles, same order)."""
+    x, y = pos
+    neighbors = []
+    for dx, dy in _ORTHOGONAL_STEPS:
+        n = (x + dx, y + dy)
+        if walkable[n]:
+            neighbors.append(n)
+    for dx, dy in _DIAGONAL_STEPS:
+        n = (x + dx, y + dy)
+        if walkable[n] and walkable[(x + dx, y)] and walkable[(x, y + dy)]:
+            neighbors.append(n)
+    return neighbors
+
+
 def find_path(
     world,
     start: tuple,
@@ -107,7 +158,12 @@ def find_path(
         return [start], 0
 
     # Use cached blocked tiles set (rebuilt only when buildings change).
-    blocked = _rebuild_blocked_cache(buildings) if buildings else set()
+    if buildings:
+        blocked = _rebuild_blocked_cache(buildings)
+        blocked_version = _BLOCKED_VERSION
+    else:
+        blocked = set()
+        blocked_version = _NO_BLOCKED_VERSION
 
     # Scale max_expansions by distance — short paths don't need 8000 nodes.
     dist = abs(start[0] - goal[0]) + abs(start[1] - goal[1])
@@ -133,21 +189,26 @@ def find_path(
     cache_key = (start, goal)
     cached = _PATH_CACHE.get(cache_key)
     if cached is not None:
+        cached_path, cached_version = cached
+        # Same blocked set as when planned (or none now): only terrain can have changed.
+        check_blocked = bool(blocked) and cached_version != blocked_version
         # Validate cached path still valid (each cell walkable or goal; non-goal not blocked)
         valid = True
-        for cell in cached:
+        is_walkable = world.is_walkable
+        for cell in cached_path:
             if cell == goal:
                 continue
-            if cell in blocked:
+            if check_blocked and cell in blocked:
                 valid = False
                 break
-            if not world.is_walkable(cell[0], cell[1]):
+            if not is_walkable(cell[0], cell[1]):
                 valid = False
                 break
         if valid:
-            return list(cached), 0
+            return list(cached_path), 0
 
     # A* algorithm
+    walkable = _WalkableMemo(world)
     open_set = []
     heapq.heappush(open_set, (0, start))
     came_from = {}
@@ -176,10 +237,10 @@ def find_path(
             if len(_PATH_CACHE) >= _PATH_CACHE_MAX:
                 first = next(iter(_PATH_CACHE))
                 del _PATH_CACHE[first]
-            _PATH_CACHE[cache_key] = path
+            _PATH_CACHE[cache_key] = (tuple(path), blocked_version)
             return path, expansions
 
-        for neighbor in get_neighbors(current, world):
+        for neighbor in _memo_neighbors(current, walkable):
             # Skip if blocked by building (unless it's the goal)
             if neighbor in blocked and neighbor != goal:
                 continue
@@ -207,12 +268,8 @@ def find_path(
 
 def grid_to_world_path(grid_path: list) -> list:
     """Convert a grid path to world coordinates (center of each tile)."""
-    world_path = []
-    for gx, gy in grid_path:
-        wx = gx * TILE_SIZE + TILE_SIZE // 2
-        wy = gy * TILE_SIZE + TILE_SIZE // 2
-        world_path.append((wx, wy))
-    return world_path
+    half = _HALF_TILE
+    return [(gx * TILE_SIZE + half, gy * TILE_SIZE + half) for gx, gy in grid_path]
 
 
 # ---------------------------------------------------------------------------
@@ -119,3 +119,44 @@ def test_defend_neutral_building_if_visible_engages_enemy_when_willing(monkeypat
     assert hero.target is enemy or (
         isinstance(hero.target, dict) and hero.target.get("type") == "defend_neutral"
     )
+
+
+def test_defend_home_building_engages_enemy_nearest_hero_within_guard_radius(monkeypatch) -> None:
+    monkeypatch.setattr("ai.behaviors.defense.sim_now_ms", lambda: 3_000)
+    hero = _Hero(x=0.0, y=0.0, attack_range=24.0)
+    hero.home_building = SimpleNamespace(center_x=TILE_SIZE * 10.0, center_y=0.0)
+    far_side = _Enemy(x=TILE_SIZE * 14.5, y=0.0)  # inside the 5-tile guard, far from hero
+    near_side = _Enemy(x=TILE_SIZE * 5.5, y=TILE_SIZE * 0.5)  # inside the guard, nearest hero
+    outside = _Enemy(x=TILE_SIZE * 2.0, y=0.0)  # nearest hero but outside the guard radius
+    dead = _Enemy(x=TILE_SIZE * 9.0, y=0.0, is_alive=False)
+
+    defense.defend_home_building(
+        _AI(),
+        hero,
+        {"buildings": [], "enemies": [far_side, outside, dead, near_side]},
+    )
+
+    assert hero.target is near_side
+
+
+def test_building_enemy_scans_are_shared_per_tick_but_hero_choice_is_not(monkeypatch) -> None:
+    monkeypatch.setattr("ai.behaviors.defense.sim_now_ms", lambda: 4_000)
+    home = SimpleNamespace(center_x=TILE_SIZE * 10.0, center_y=0.0)
+    west = _Enemy(x=TILE_SIZE * 7.0, y=0.0)
+    east = _Enemy(x=TILE_SIZE * 13.0, y=0.0)
+    view = SimpleNamespace(buildings=[], enemies=[west, east])
+
+    west_hero = _Hero(x=0.0, y=0.0, attack_range=8.0)
+    east_hero = _Hero(x=TILE_SIZE * 20.0, y=0.0, attack_range=8.0)
+    for hero in (west_hero, east_hero):
+        hero.home_building = home
+        defense.defend_home_building(_AI(), hero, view)
+    assert west_hero.target is west
+    assert east_hero.target is east
+    assert defense._enemies_guarding_building(view, home) == ((west, west.x, west.y), (east, east.x, east.y))
+    assert defense._enemies_guarding_building(view, home) is defense._enemies_guarding_building(view, home)
+
+    castle = SimpleNamespace(center_x=TILE_SIZE * 12.0, center_y=0.0)
+    for hero in (_Hero(x=0.0, y=0.0), _Hero(x=TILE_SIZE * 30.0, y=0.0)):
+        defense.defend_castle(_AI(), hero, view, castle)
+        assert hero.target is east  # nearest to the castle, whoever asks
@@ -94,6 +94,44 @@ def test_find_black_fog_frontier_tiles_honors_distance_filters() -> None:
     assert candidates == []
 
 
+def _frontier_reference(world, hero, scan_radius: int) -> list:
+    """Straightforward bounds-checked 8-neighbour scan (the pre-optimization loop)."""
+    hero_gx = int(hero.x // TILE_SIZE)
+    hero_gy = int(hero.y // TILE_SIZE)
+    out = []
+    for dy in range(-scan_radius, scan_radius + 1):
+        for dx in range(-scan_radius, scan_radius + 1):
+            gx, gy = hero_gx + dx, hero_gy + dy
+            if not (0 <= gx < world.width and 0 <= gy < world.height):
+                continue
+            if world.visibility[gy][gx] != Visibility.UNSEEN:
+                continue
+            if any(
+                0 <= gx + ax < world.width
+                and 0 <= gy + ay < world.height
+                and world.visibility[gy + ay][gx + ax] in (Visibility.SEEN, Visibility.VISIBLE)
+                for ay in (-1, 0, 1)
+                for ax in (-1, 0, 1)
+                if ax or ay
+            ):
+                out.append((gx, gy, math.sqrt(dx * dx + dy * dy)))
+    out.sort(key=lambda c: (c[2], c[1], c[0]))
+    return out
+
+
+def test_find_black_fog_frontier_tiles_matches_reference_scan_at_map_edges() -> None:
+    import random
+
+    rng = random.Random(11)
+    world = _World(size=16)
+    states = (Visibility.UNSEEN, Visibility.UNSEEN, Visibility.SEEN, Visibility.VISIBLE)
+    world.visibility = [[rng.choice(states) for _ in range(16)] for _ in range(16)]
+    for tile_x, tile_y in ((0, 0), (15, 15), (3, 14), (8, 8), (-2, 5)):
+        hero = _Hero(tile_x=tile_x, tile_y=tile_y)
+        got = exploration._find_black_fog_frontier_tiles(world, hero, max_candidates=500, scan_radius=6)
+        assert got == _frontier_reference(world, hero, 6)
+
+
 def test_explore_ranger_uses_frontier_bias_and_sets_commit(monkeypatch) -> None:
     monkeypatch.setattr("ai.behaviors.exploration.sim_now_ms", lambda: 1_000)
     monkeypatch.setattr("ai.behaviors.exploration.RANGER_EXPLORE_BLACK_FOG_BIAS", 1.0)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from ai import task_router
+from game.entities.hero import HeroState
+
+
+def _hero(*, under_attack: bool = False) -> SimpleNamespace:
+    home = SimpleNamespace(is_under_attack=under_attack, is_damaged=False)
+    return SimpleNamespace(inside_building=home, home_building=home, state=HeroState.RESTING)
+
+
+def test_cadence_disabled_by_default_passes_dt_through() -> None:
+    assert task_router.RESTING_POLL_INTERVAL_MS == 0
+    assert task_router._resting_poll_dt(_hero(), 0.05, 1_000) == 0.05
+
+
+def test_cadence_banks_skipped_dt_and_applies_it_on_the_next_poll(monkeypatch) -> None:
+    monkeypatch.setattr(task_router, "RESTING_POLL_INTERVAL_MS", 250)
+    hero = _hero()
+    assert task_router._resting_poll_dt(hero, 0.05, 1_000) == 0.05
+    assert task_router._resting_poll_dt(hero, 0.05, 1_050) is None
+    assert task_router._resting_poll_dt(hero, 0.05, 1_100) is None
+    assert abs(task_router._resting_poll_dt(hero, 0.05, 1_250) - 0.15) < 1e-9
+
+
+def test_cadence_polls_immediately_when_rest_building_is_attacked(monkeypatch) -> None:
+    monkeypatch.setattr(task_router, "RESTING_POLL_INTERVAL_MS", 250)
+    hero = _hero()
+    task_router._resting_poll_dt(hero, 0.05, 1_000)
+    hero.home_building.is_under_attack = True
+    assert abs(task_router._resting_poll_dt(hero, 0.05, 1_050) - 0.05) < 1e-9
+
+
+def test_cadence_bank_does_not_carry_into_the_next_rest_episode(monkeypatch) -> None:
+    monkeypatch.setattr(task_router, "RESTING_POLL_INTERVAL_MS", 250)
+    monkeypatch.setattr(task_router, "as_ai_view", lambda view: view)
+    monkeypatch.setattr(task_router, "sim_now_ms", lambda: 1_200)
+
+    class _Stop(Exception):
+        pass
+
+    def _stop(*_args) -> None:
+        raise _Stop
+
+    hero = _hero()
+    assert task_router._resting_poll_dt(hero, 0.05, 1_000) == 0.05
+    assert task_router._resting_poll_dt(hero, 0.05, 1_050) is None
+    assert task_router._resting_poll_dt(hero, 0.05, 1_100) is None
+
+    # The hero leaves RESTING; its next AI tick drops the episode's bank.
+    hero.state = HeroState.IDLE
+    try:
+        task_router.update_hero(SimpleNamespace(refresh_intent=_stop), hero, 0.05, None)
+    except _Stop:
+        pass
+
+    # Re-entering rest at 1300 polls with this tick's dt only, not 0.15.
+    hero.state = HeroState.RESTING
+    assert abs(task_router._resting_poll_dt(hero, 0.05, 1_300) - 0.05) < 1e-9
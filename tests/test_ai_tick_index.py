@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import math
+import random
+from types import SimpleNamespace
+
+from ai.behaviors import tick_index
+from config import TILE_SIZE
+
+
+class _Enemy:
+    def __init__(self, *, x: float, y: float, is_alive: bool = True) -> None:
+        self.x = float(x)
+        self.y = float(y)
+        self.is_alive = bool(is_alive)
+
+
+class _View:
+    """Minimal stand-in for AiGameView (plain attribute object, memo-capable)."""
+
+    def __init__(self, enemies: list) -> None:
+        self.enemies = enemies
+
+
+def _brute_force(enemies, x: float, y: float, radius: float) -> list:
+    out = []
+    for enemy in enemies:
+        if not enemy.is_alive:
+            continue
+        dist = math.sqrt((x - enemy.x) ** 2 + (y - enemy.y) ** 2)
+        if dist <= radius:
+            out.append((enemy, dist))
+    return out
+
+
+def test_enemies_within_matches_linear_scan_in_view_order() -> None:
+    rng = random.Random(7)
+    enemies = [
+        _Enemy(x=rng.uniform(-400, 2400), y=rng.uniform(-400, 2400), is_alive=rng.random() > 0.2)
+        for _ in range(200)
+    ]
+    view = _View(enemies)
+    for _ in range(100):
+        x, y = rng.uniform(0, 2000), rng.uniform(0, 2000)
+        radius = TILE_SIZE * rng.choice((1.5, 5, 6, 12))
+        expected = _brute_force(enemies, x, y, radius)
+        assert tick_index.enemies_within(view, x, y, radius) == expected
+        assert tick_index.any_enemy_within(view, x, y, radius) is bool(expected)
+
+
+def test_nearest_enemy_within_matches_sorted_linear_scan() -> None:
+    rng = random.Random(11)
+    enemies = [
+        _Enemy(x=rng.randrange(0, 60) * 16.0, y=rng.randrange(0, 60) * 16.0, is_alive=rng.random() > 0.2)
+        for _ in range(150)
+    ]
+    view = _View(enemies)
+    for _ in range(100):
+        x, y = rng.randrange(0, 60) * 16.0, rng.randrange(0, 60) * 16.0
+        radius = TILE_SIZE * rng.choice((1.5, 5, 6))
+        expected = sorted(_brute_force(enemies, x, y, radius), key=lambda row: row[1])
+        got = tick_index.nearest_enemy_within(view, x, y, radius)
+        if expected:
+            assert got[0] is expected[0][0] and got[1] == expected[0][1]
+        else:
+            assert got == (None, math.inf)
+
+
+def test_radius_boundary_is_inclusive() -> None:
+    enemy = _Enemy(x=TILE_SIZE * 5, y=0.0)
+    view = _View([enemy])
+    assert tick_index.enemies_within(view, 0.0, 0.0, TILE_SIZE * 5) == [(enemy, TILE_SIZE * 5)]
+
+
+def test_grid_is_memoized_per_view() -> None:
+    view = _View([_Enemy(x=10.0, y=10.0)])
+    grid = tick_index.enemy_grid(view)
+    assert tick_index.enemy_grid(view) is grid
+    assert view._mythos_tick_memo["enemy_grid"] is grid
+    # A fresh view (next tick) gets a fresh index.
+    assert tick_index.enemy_grid(_View(view.enemies)) is not grid
+
+
+def test_slots_view_falls_back_to_uncached_queries() -> None:
+    class _SlotsView:
+        __slots__ = ("enemies",)
+
+        def __init__(self, enemies: list) -> None:
+            self.enemies = enemies
+
+    enemy = _Enemy(x=32.0, y=0.0)
+    view = _SlotsView([enemy])
+    assert tick_index.view_tick_memo(view) is None
+    assert tick_index.any_enemy_within(view, 0.0, 0.0, TILE_SIZE * 5)
+    assert not tick_index.any_enemy_within(SimpleNamespace(enemies=[]), 0.0, 0.0, TILE_SIZE * 5)
+
+
+def test_nearest_enemy_matches_first_wins_linear_scan() -> None:
+    rng = random.Random(11)
+    enemies = [
+        _Enemy(x=float(rng.randrange(0, 40) * 32), y=float(rng.randrange(0, 40) * 32), is_alive=rng.random() > 0.3)
+        for _ in range(120)
+    ]
+    view = _View(enemies)
+    for _ in range(60):
+        x, y = float(rng.randrange(0, 40) * 32), float(rng.randrange(0, 40) * 32)
+        best, best_dist = None, float("inf")
+        for enemy in enemies:
+            if enemy.is_alive:
+                dist = math.sqrt((enemy.x - x) ** 2 + (enemy.y - y) ** 2)
+                if dist < best_dist:
+                    best, best_dist = enemy, dist
+        assert tick_index.nearest_enemy(view, x, y) == (best, best_dist)
+
+
+def test_nearest_enemy_none_when_no_living_enemies() -> None:
+    view = _View([_Enemy(x=0.0, y=0.0, is_alive=False)])
+    assert tick_index.nearest_enemy(view, 5.0, 5.0) == (None, float("inf"))
+
+
+def test_alive_enemies_filters_once_per_view_in_order() -> None:
+    a, dead, b = _Enemy(x=0, y=0), _Enemy(x=1, y=1, is_alive=False), _Enemy(x=2, y=2)
+    view = _View([a, dead, b])
+    alive = tick_index.alive_enemies(view)
+    assert alive == (a, b)
+    assert tick_index.alive_enemies(view) is alive
+    assert tick_index.alive_enemies(_View(None)) == ()
+
+
+def test_nearest_index_kernel_first_index_wins_ties() -> None:
+    xs = (10.0, -10.0, 0.0, 10.0)
+    ys = (0.0, 0.0, 20.0, 0.0)
+    assert tick_index.nearest_index(xs, ys, 0.0, 0.0) == (0, 100.0)
+    assert tick_index.nearest_index((), (), 0.0, 0.0) == (-1, float("inf"))
+
+
+def test_safe_buildings_snapshot_and_nearest() -> None:
+    castle = SimpleNamespace(building_type="castle", center_x=500.0, center_y=500.0)
+    inn = SimpleNamespace(building_type="inn", center_x=10.0, center_y=10.0)
+    market = SimpleNamespace(building_type="marketplace", center_x=100.0, center_y=0.0)
+    view = SimpleNamespace(buildings=[castle, inn, market], enemies=[])
+    safe, xs, ys = tick_index.safe_buildings(view)
+    assert safe == (castle, market)
+    assert (xs, ys) == ((500.0, 100.0), (500.0, 0.0))
+    assert tick_index.nearest_safe_building(view, 0.0, 0.0) == (market, 10000.0)
+    assert tick_index.nearest_safe_building(SimpleNamespace(buildings=[inn]), 0.0, 0.0) == (None, float("inf"))
+
+
+def test_buildings_of_type_keeps_view_order_and_matches_enum_members() -> None:
+    from game.entities.buildings.types import BuildingType
+
+    inn = SimpleNamespace(building_type=BuildingType.INN)
+    smith = SimpleNamespace(building_type="blacksmith")
+    market = SimpleNamespace(building_type="marketplace")
+    view = SimpleNamespace(buildings=[market, inn, smith, SimpleNamespace()])
+    assert tick_index.buildings_of_type(view, "inn") == (inn,)
+    assert tick_index.buildings_of_type(view, "blacksmith", "marketplace") == (market, smith)
+    assert tick_index.buildings_of_type(view, BuildingType.INN) is tick_index.buildings_of_type(view, BuildingType.INN)
+
+
+def test_bounty_by_id_matches_first_wins_linear_scan() -> None:
+    from ai.behaviors.bounty_pursuit import _resolve_bounty_from_target
+
+    first = SimpleNamespace(bounty_id=7)
+    dup = SimpleNamespace(bounty_id=7)
+    other = SimpleNamespace(bounty_id=3)
+    anon = SimpleNamespace()
+    bounties = [anon, first, other, dup]
+    view = SimpleNamespace(bounties=bounties)
+    by_id = tick_index.bounty_by_id(view)
+    assert by_id == {7: first, 3: other}
+    assert tick_index.bounty_by_id(view) is by_id
+    for target in ({"bounty_id": 7}, {"bounty_id": 3}, {"bounty_id": 99}, {"bounty_ref": anon}, {}):
+        assert _resolve_bounty_from_target(target, bounties, by_id) is _resolve_bounty_from_target(target, bounties)
+
+
+def test_legacy_context_is_shared_per_tick_and_matches_fresh_projection() -> None:
+    from ai.behaviors.view_compat import as_ai_view, view_to_legacy_context
+
+    view = SimpleNamespace(
+        world=None, buildings=[], enemies=[], heroes=[], bounties=[], pois=[],
+        player_gold=120, castle=None,
+    )
+    legacy = tick_index.legacy_context(view)
+    assert legacy == view_to_legacy_context(view)
+    assert tick_index.legacy_context(view) is legacy
+    # Legacy-dict adapter (slots, no memo): fresh projection every call.
+    adapter = as_ai_view({"gold": 5})
+    assert tick_index.legacy_context(adapter) is not tick_index.legacy_context(adapter)
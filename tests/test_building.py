@@ -132,6 +132,26 @@ def test_blacksmith_research_unlocks_upgraded_items() -> None:
     assert "Mithril Blade" in item_names
 
 
+def test_blacksmith_items_by_type_refreshes_after_research_unlock() -> None:
+    blacksmith = Blacksmith(0, 0)
+    before = blacksmith.get_items_by_type()
+    assert blacksmith.get_items_by_type() is before  # cached between calls
+    assert "Steel Sword" not in {item["name"] for item in before.get("weapon", [])}
+
+    RESEARCH_UNLOCKS["Weapon Upgrades"] = True
+    after = blacksmith.get_items_by_type()
+    assert "Steel Sword" in {item["name"] for item in after["weapon"]}
+    flat = [item for bucket in after.values() for item in bucket]
+    assert sorted(i["name"] for i in flat) == sorted(i["name"] for i in blacksmith.get_available_items())
+
+
+def test_marketplace_items_by_type_tracks_potion_price() -> None:
+    marketplace = Marketplace(0, 0)
+    assert marketplace.get_items_by_type()["potion"][0]["price"] == marketplace.potion_price
+    marketplace.potion_price = 33
+    assert marketplace.get_items_by_type()["potion"][0]["price"] == 33
+
+
 def test_marketplace_accumulates_shop_tax_in_stored_tax_gold() -> None:
     marketplace = Marketplace(0, 0)
     hero = Hero(0.0, 0.0, name="Buyer")
@@ -72,3 +72,24 @@ def test_apply_move_to_unresolved_falls_back_to_explore():
     apply_llm_decision(ai, hero, {"action": "move_to", "target": "castle"}, gs, source="mock")
     assert hero.llm_move_request is None
     assert ai.explore_calls == 1
+
+
+def test_plain_action_takes_precedence_over_tool_action():
+    ai = _FakeAI()
+    hero = Hero(10.0, 10.0, name="T", hero_id="t_prec")
+    hero.state = HeroState.IDLE
+    gs: dict = {"buildings": [], "enemies": [], "heroes": [hero], "bounties": []}
+    apply_llm_decision(ai, hero, {"action": "fight", "tool_action": "leave_building"}, gs, source="mock")
+    assert hero.state == HeroState.FIGHTING
+
+
+def test_tool_action_dispatches_when_action_is_not_a_plain_action():
+    ai = _FakeAI()
+    hero = Hero(10.0, 10.0, name="T", hero_id="t_tool")
+    hero.state = HeroState.RESTING
+    hero.is_inside_building = True
+    gs: dict = {"buildings": [], "enemies": [], "heroes": [hero], "bounties": []}
+    apply_llm_decision(ai, hero, {"action": "move_to", "tool_action": "leave_building"}, gs, source="mock")
+    assert hero.state == HeroState.IDLE
+    assert hero.is_inside_building is False
+    assert hero.llm_move_request is None
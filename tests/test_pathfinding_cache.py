@@ -0,0 +1,103 @@
+"""Path-cache versioning tests (game/systems/pathfinding.py).
+
+Cached paths are tagged with the blocked-set version they were planned under;
+a hit under the same version skips the blocked re-check, any other version
+(or a terrain change) must still invalidate the cached route.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from config import TILE_SIZE
+from game.systems import pathfinding
+
+
+class _World:
+    def __init__(self, w=20, h=20):
+        self.w = w
+        self.h = h
+        self.walls: set[tuple[int, int]] = set()
+
+    def is_walkable(self, x, y):
+        return 0 <= x < self.w and 0 <= y < self.h and (x, y) not in self.walls
+
+
+def _building(gx, gy, size=(1, 1)):
+    return SimpleNamespace(grid_x=gx, grid_y=gy, size=size, is_constructed=True)
+
+
+@pytest.fixture(autouse=True)
+def _clean_caches():
+    pathfinding._PATH_CACHE.clear()
+    pathfinding.invalidate_blocked_cache()
+    yield
+    pathfinding._PATH_CACHE.clear()
+    pathfinding.invalidate_blocked_cache()
+
+
+def test_cache_hit_same_layout_costs_no_expansions():
+    world = _World()
+    buildings = [_building(15, 15)]
+    path, expansions = pathfinding.find_path(world, (1, 1), (8, 1), buildings)
+    assert path and expansions > 0
+
+    again, expansions2 = pathfinding.find_path(world, (1, 1), (8, 1), buildings)
+    assert again == path
+    assert expansions2 == 0
+    again.append((99, 99))  # callers get a private copy
+    assert pathfinding.find_path(world, (1, 1), (8, 1), buildings)[0] == path
+
+
+def test_new_building_on_route_invalidates_cached_path():
+    world = _World()
+    buildings = [_building(15, 15)]
+    path, _ = pathfinding.find_path(world, (1, 1), (8, 1), buildings)
+    assert (4, 1) in path
+
+    buildings.append(_building(4, 1))
+    pathfinding.invalidate_blocked_cache()
+    replanned, expansions = pathfinding.find_path(world, (1, 1), (8, 1), buildings)
+    assert expansions > 0
+    assert (4, 1) not in replanned
+
+
+def test_path_planned_without_buildings_is_checked_against_blocked_set():
+    world = _World()
+    path, _ = pathfinding.find_path(world, (1, 1), (8, 1))
+    assert (4, 1) in path
+
+    replanned, expansions = pathfinding.find_path(world, (1, 1), (8, 1), [_building(4, 1)])
+    assert expansions > 0
+    assert (4, 1) not in replanned
+
+
+def test_terrain_change_invalidates_cached_path_under_same_layout():
+    world = _World()
+    buildings = [_building(15, 15)]
+    path, _ = pathfinding.find_path(world, (1, 1), (8, 1), buildings)
+    world.walls.add(path[3])
+
+    replanned, expansions = pathfinding.find_path(world, (1, 1), (8, 1), buildings)
+    assert expansions > 0
+    assert path[3] not in replanned
+
+
+def test_grid_to_world_path_uses_tile_centers():
+    half = TILE_SIZE // 2
+    assert pathfinding.grid_to_world_path([(0, 0), (2, 3)]) == [
+        (half, half),
+        (2 * TILE_SIZE + half, 3 * TILE_SIZE + half),
+    ]
+    assert pathfinding.grid_to_world_path([]) == []
+
+
+def test_memoized_neighbors_match_get_neighbors():
+    world = _World(8, 8)
+    world.walls.update({(2, 2), (3, 4), (5, 1), (0, 6)})
+    walkable = pathfinding._WalkableMemo(world)
+    for x in range(-1, 9):
+        for y in range(-1, 9):
+            assert pathfinding._memo_neighbors((x, y), walkable) == pathfinding.get_neighbors((x, y), world)
@@ -194,3 +194,21 @@ def test_basic_ai_source_references_task_router_update_hero() -> None:
         "ai/basic_ai.py does not reference task_router.update_hero -- the update_hero "
         "wrapper must delegate to the relocated module function"
     )
+
+
+# ---------------------------------------------------------------------------
+# (6) STATE DISPATCH TABLE — every state-machine state maps to the BasicAI
+#     handler the old if/elif chain called; RESTING is handled before it.
+# ---------------------------------------------------------------------------
+def test_state_dispatch_table_names_basic_ai_handlers() -> None:
+    from game.entities.hero import HeroState
+
+    assert tr._STATE_HANDLERS == {
+        HeroState.IDLE: "handle_idle",
+        HeroState.MOVING: "handle_moving",
+        HeroState.FIGHTING: "handle_fighting",
+        HeroState.RETREATING: "handle_retreating",
+        HeroState.SHOPPING: "handle_shopping",
+    }
+    for name in tr._STATE_HANDLERS.values():
+        assert callable(getattr(BasicAI, name))
@@ -367,6 +367,21 @@ def test_autonomous_prompt_rich_scenario_carries_inventory_and_pois():
     assert "tiles" in prompt
 
 
+def test_autonomous_prompt_reuses_caller_hero_context_byte_identically():
+    _, _, ranger_guild, market = _base_layout()
+    hero = _rich_hero(ranger_guild)
+    hero.state = HeroState.IDLE
+    gs = _rich_gs_and_pois(hero, ranger_guild, market)
+    moment = moment_idle_seeking_activity(hero, gs)
+    assert moment is not None
+
+    rebuilt = build_llm_context_for_moment(hero, gs, moment, now_ms=NOW_MS)
+    reused = build_llm_context_for_moment(
+        hero, gs, moment, now_ms=NOW_MS, hero_context=ContextBuilder.build_hero_context(hero, gs)
+    )
+    assert build_autonomous_user_prompt(reused) == build_autonomous_user_prompt(rebuilt)
+
+
 def test_autonomous_prompt_quest_offer_moment_carries_quest_block():
     _, _, ranger_guild, market = _base_layout()
     hero = _rich_hero(ranger_guild)
@@ -551,6 +566,58 @@ def test_pending_llm_decision_watchdog_clears_with_hanging_provider():
         brain.stop()
 
 
+def test_parallel_llm_workers_do_not_queue_behind_a_hanging_request(monkeypatch):
+    """With LLM_WORKER_THREADS > 1 a slow provider call does not stall other heroes."""
+    import ai.llm_brain as llm_brain_mod
+
+    class _FirstCallHangsProvider(_StubProvider):
+        def __init__(self, payload: dict):
+            super().__init__(payload)
+            self.release = threading.Event()
+            self.first_call_started = threading.Event()
+            self._calls = 0
+            self._calls_lock = threading.Lock()
+
+        def complete(self, system_prompt: str, user_prompt: str, timeout: float = 5.0) -> str:
+            with self._calls_lock:
+                self._calls += 1
+                first = self._calls == 1
+            if first:
+                self.first_call_started.set()
+                self.release.wait(timeout=60.0)
+            return super().complete(system_prompt, user_prompt, timeout)
+
+    monkeypatch.setattr(llm_brain_mod, "LLM_WORKER_THREADS", 2)
+    _, _, ranger_guild, market = _base_layout()
+    hero = _hero(ranger_guild, hero_id="wk134_par", name="RangerPar")
+    hero.state = HeroState.IDLE
+    gs = _game_state(hero, [ranger_guild, market])
+    moment = moment_idle_seeking_activity(hero, gs)
+    assert moment is not None
+    context = {
+        **ContextBuilder.build_hero_context(hero, gs),
+        "wk50_autonomous": build_llm_context_for_moment(hero, gs, moment, now_ms=NOW_MS),
+    }
+
+    brain = LLMBrain(provider_name="mock")
+    provider = _FirstCallHangsProvider({"action": "explore", "target": "", "reasoning": "wander", "confidence": 0.9})
+    brain.provider = provider
+    try:
+        assert len(brain.worker_threads) == 2
+        brain.request_decision("slow_hero", context)
+        # Wait until one worker is inside (and hanging on) the slow request.
+        assert provider.first_call_started.wait(timeout=10.0)
+        brain.request_decision("fast_hero", context)
+        fast = _drain_decision(brain, "fast_hero")
+        assert fast is not None and fast["action"] == "explore"
+        assert brain.get_decision("slow_hero") is None
+        provider.release.set()
+        assert _drain_decision(brain, "slow_hero") is not None
+    finally:
+        provider.release.set()
+        brain.stop()
+
+
 # ===========================================================================
 # 4. E2E command-following (REAL chat path, seeded MockProvider)
 # ===========================================================================
@@ -722,3 +789,138 @@ def test_e2e_leave_building():
     assert applied is True
     assert hero.is_inside_building is False
     assert hero.state == HeroState.IDLE
+
+
+def test_get_decision_miss_does_not_take_response_lock():
+    """The per-tick pending poll answers a miss without touching the lock."""
+
+    class _ExplodingLock:
+        def __enter__(self):
+            raise AssertionError("miss path must not acquire response_lock")
+
+        def __exit__(self, *exc):
+            return False
+
+    brain = LLMBrain(provider_name="mock")
+    try:
+        real_lock = brain.response_lock
+        brain.response_lock = _ExplodingLock()
+        assert brain.get_decision("hero_x") is None
+        brain.response_lock = real_lock
+        with brain.response_lock:
+            brain.responses["hero_x"] = {"action": "explore"}
+        assert brain.get_decision("hero_x") == {"action": "explore"}
+        assert brain.get_decision("hero_x") is None
+    finally:
+        brain.stop()
+
+
+def test_request_queue_serves_urgent_moments_and_chat_first():
+    """Queued requests drain by urgency (chat first), FIFO within a priority."""
+
+    def _ctx(urgency):
+        return {"wk50_autonomous": {"moment": {"type": "x", "urgency": urgency}}}
+
+    brain = LLMBrain(provider_name="mock", autostart=False)  # no worker racing us
+    brain.request_decision("idle_a", _ctx(0))
+    brain.request_decision("legacy", {})
+    brain.request_decision("critical", _ctx(2))
+    brain.request_conversation("chatter", {}, [], "hello")
+    brain.request_decision("low_hp", _ctx(1))
+    brain.request_decision("idle_b", _ctx(0))
+
+    order = []
+    while not brain.request_queue.empty():
+        _rank, _seq, item = brain.request_queue.get_nowait()
+        order.append(item[0])
+    assert order == ["chatter", "critical", "low_hp", "idle_a", "legacy", "idle_b"]
+
+
+def test_request_queue_ages_low_urgency_requests_past_an_urgent_stream():
+    """An idle moment keeps losing to fresher urgent consults only for a bounded window."""
+    from ai.llm_brain import _PRIORITY_AGING_SEQ
+
+    def _ctx(urgency):
+        return {"wk50_autonomous": {"moment": {"type": "x", "urgency": urgency}}}
+
+    brain = LLMBrain(provider_name="mock", autostart=False)
+    brain.request_decision("idle", _ctx(0))
+    served = []
+    for i in range(10 * _PRIORITY_AGING_SEQ):
+        # One new critical consult arrives for every request the worker serves.
+        brain.request_decision(f"urgent_{i}", _ctx(2))
+        _rank, _seq, item = brain.request_queue.get_nowait()
+        served.append(item[0])
+        if item[0] == "idle":
+            break
+    assert served[-1] == "idle"
+    assert served[0].startswith("urgent_")  # urgency still overtakes at first
+    assert len(served) <= 2 * _PRIORITY_AGING_SEQ + 1
+
+
+def test_unstarted_brain_answers_only_when_drained():
+    """``autostart=False``: no worker threads; answers land when the owner drains."""
+    brain = LLMBrain(provider_name="mock", autostart=False)
+    assert brain.worker_threads == []
+    brain.request_conversation("hero_d", {}, [], "hello")
+    assert brain.get_conversation_response("hero_d") is None
+    assert brain.drain_pending() == 1
+    assert brain.get_conversation_response("hero_d") is not None
+    assert brain.drain_pending() == 0
+    brain.stop()
+
+
+def test_drained_brain_delivers_every_answer_on_a_fixed_tick():
+    """Draining once per tick makes delivery a pure function of the request script."""
+    _, _, ranger_guild, market = _base_layout()
+    hero = _hero(ranger_guild, hero_id="wk134_drain", name="RangerDrain")
+    hero.state = HeroState.IDLE
+    gs = _game_state(hero, [ranger_guild, market])
+    moment = moment_idle_seeking_activity(hero, gs)
+    assert moment is not None
+    idle_ctx = {
+        **ContextBuilder.build_hero_context(hero, gs),
+        "wk50_autonomous": build_llm_context_for_moment(hero, gs, moment, now_ms=NOW_MS),
+    }
+    urgent_aut = dict(idle_ctx["wk50_autonomous"])
+    urgent_aut["moment"] = {**urgent_aut["moment"], "urgency": 2}
+    urgent_ctx = {**idle_ctx, "wk50_autonomous": urgent_aut}
+    script = (
+        [("idle_a", idle_ctx), ("urgent_a", urgent_ctx)],
+        [],
+        [("idle_b", idle_ctx), ("idle_c", idle_ctx), ("urgent_b", urgent_ctx)],
+    )
+
+    class _RecordingProvider(_StubProvider):
+        def __init__(self, payload: dict):
+            super().__init__(payload)
+            self.threads = []
+
+        def complete(self, system_prompt: str, user_prompt: str, timeout: float = 5.0) -> str:
+            self.threads.append(threading.current_thread())
+            return super().complete(system_prompt, user_prompt, timeout)
+
+    def _run() -> list:
+        brain = LLMBrain(provider_name="mock", autostart=False)
+        provider = _RecordingProvider({"action": "explore", "target": "", "reasoning": "wander", "confidence": 0.9})
+        brain.provider = provider
+        log = []
+        keys = [key for tick in script for key, _ctx in tick]
+        for tick, requests in enumerate(script):
+            for key, ctx in requests:
+                brain.request_decision(key, ctx)
+            assert all(brain.get_decision(key) is None for key, _ctx in requests)
+            served = brain.drain_pending()
+            delivered = [key for key in keys if brain.get_decision(key) is not None]
+            log.append((tick, served, delivered))
+        brain.stop()
+        assert provider.threads and all(t is threading.main_thread() for t in provider.threads)
+        return log
+
+    first = _run()
+    assert first == [
+        (0, 2, ["idle_a", "urgent_a"]),
+        (1, 0, []),
+        (2, 3, ["idle_b", "idle_c", "urgent_b"]),
+    ]
+    assert _run() == first
@@ -236,3 +236,20 @@ def test_daily_life_splits_ten_heroes_across_richer_motives_and_clusters(monkeyp
         if target_xy is not None
     ]
     assert max(far_targets) > 15.0
+
+
+def test_ambient_building_pools_are_shared_per_tick_and_filter_like_the_pickers() -> None:
+    view, _heroes, castle = _build_view()
+    inn = view.buildings[1]
+    inn.is_under_attack = True
+    dead_lair = _Building("lair", 2 * TILE_SIZE, 2 * TILE_SIZE, entity_id="dead_lair", is_lair=True, hp=0)
+    view.buildings.append(dead_lair)
+
+    pools = daily_life._ambient_building_pools(view, view.buildings)
+    assert daily_life._ambient_building_pools(view, view.buildings) is pools
+
+    assert inn in pools["roam"]
+    assert inn not in pools["rest"] and inn not in pools["social"]
+    assert castle in pools["rest"] and castle in pools["opportunity"]
+    assert [b.entity_id for b in pools["lairs"]] == ["lair"]
+    assert pools["by_slug"]["warrior_guild"] == (view.buildings[7],)
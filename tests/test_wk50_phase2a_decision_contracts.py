@@ -203,6 +203,24 @@ def test_shopping_opportunity_when_idle_near_market_with_gold_need():
     assert "buy_item" in m.allowed_actions
 
 
+def test_shopping_opportunity_tracks_in_place_building_swap():
+    px, py = 100.0, 100.0
+    h = Hero(px, py, name="Shopper", hero_id="shop2")
+    h.state = HeroState.IDLE
+    h.hp = int(h.max_hp)
+    h.gold = 100
+    h.potions = 2
+    buildings = [_market(px + 10.0, py)]
+    gs = {"buildings": buildings, "enemies": [], "heroes": [h], "bounties": []}
+    m = determine_decision_moment(h, gs, now_ms=10_000)
+    assert m is not None and m.moment_type == DecisionMomentType.SHOPPING_OPPORTUNITY
+
+    # Same list, same length: the marketplace is replaced by a far-away house.
+    buildings[0] = SimpleNamespace(center_x=px + 9999.0, center_y=py, building_type="house", hp=100)
+    m = determine_decision_moment(h, gs, now_ms=10_000)
+    assert m is None or m.moment_type != DecisionMomentType.SHOPPING_OPPORTUNITY
+
+
 def test_idle_seeking_activity_when_healthy_idle_outside():
     h = Hero(100.0, 100.0, name="IdleHero", hero_id="idle1")
     h.state = HeroState.IDLE
@@ -297,6 +315,31 @@ def test_should_consult_llm_named_moment_respects_cooldown_and_pending():
         timebase.set_sim_now_ms(None)
 
 
+def test_should_consult_llm_skips_moment_scan_while_suppressed(monkeypatch):
+    from game.sim import timebase
+
+    def _no_scan(*_a, **_k):
+        raise AssertionError("moment scan must not run while the consult is suppressed")
+
+    h = Hero(0.0, 0.0, name="Gate", hero_id="g2")
+    h.state = HeroState.FIGHTING
+    h.hp = 20
+    h.max_hp = 100
+    gs = {"buildings": [], "enemies": [], "heroes": [h], "bounties": []}
+    monkeypatch.setattr(llm_bridge, "determine_decision_moment", _no_scan)
+    try:
+        timebase.set_sim_now_ms(100_000)
+        h.last_llm_decision_time = 0
+        h.pending_llm_decision = True
+        assert llm_bridge.should_consult_llm(None, h, gs) is False
+
+        h.pending_llm_decision = False
+        h.last_llm_decision_time = 100_000 - (LLM_DECISION_COOLDOWN - 1)
+        assert llm_bridge.should_consult_llm(None, h, gs) is False
+    finally:
+        timebase.set_sim_now_ms(None)
+
+
 def test_llm_brain_autonomous_path_validates_against_moment():
     h = Hero(10.0, 10.0, name="Brainy", hero_id="b1")
     h.state = HeroState.FIGHTING
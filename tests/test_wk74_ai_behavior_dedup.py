@@ -32,7 +32,7 @@ from game.sim.hero_guardrails_tunables import TARGET_COMMIT_WINDOW_S
 
 import ai.behaviors.movement as movement
 from ai.behaviors.movement import route_to_building
-from ai.behaviors.defense import engage, _commit_until_ms
+from ai.behaviors.defense import engage, engage_or_chase, _commit_until_ms
 
 
 # --------------------------------------------------------------------------- #
@@ -183,5 +183,22 @@ def test_engage_set_position_false_skips_set_target_position():
     assert hero._target_commit_until_ms == _expected_commit(now)
 
 
+@pytest.mark.parametrize(
+    "attack_range, state, steered",
+    [(200.0, HeroState.FIGHTING, False), (50.0, HeroState.MOVING, True)],
+)
+def test_engage_or_chase_fights_in_range_else_moves(attack_range, state, steered):
+    hero = _FakeHero(x=0.0, y=0.0)
+    hero.attack_range = attack_range
+    enemy = _FakeEnemy(x=60.0, y=80.0)  # 100px away
+
+    engage_or_chase(hero, enemy, 1_234)
+
+    assert hero.target is enemy
+    assert hero.state == state
+    assert hero.set_target_position_calls == ([(60.0, 80.0)] if steered else [])
+    assert hero._target_commit_until_ms == _expected_commit(1_234)
+
+
 if __name__ == "__main__":  # pragma: no cover
     raise SystemExit(pytest.main([__file__, "-q"]))